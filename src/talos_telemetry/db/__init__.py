@@ -1,7 +1,13 @@
 """Database module - Kuzu graph database operations."""
 
 from talos_telemetry.db.connection import get_connection, init_database
-from talos_telemetry.db.schema import deploy_schema
+from talos_telemetry.db.kuzu_schema import deploy_schema, verify_schema
 from talos_telemetry.db.seed import seed_reference_data
 
-__all__ = ["get_connection", "init_database", "deploy_schema", "seed_reference_data"]
+__all__ = [
+    "get_connection",
+    "init_database",
+    "deploy_schema",
+    "verify_schema",
+    "seed_reference_data",
+]
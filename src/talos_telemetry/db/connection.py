@@ -1,16 +1,29 @@
 """Kuzu database connection management."""
 
+from __future__ import annotations
+
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import kuzu
+if TYPE_CHECKING:
+    import kuzu
 
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".talos" / "telemetry" / "kuzu"
 
-# Module-level connection cache
+# Module-level database cache. The Database (and its buffer pool) is shared
+# process-wide; Connections are not safe to share across threads, so each
+# thread gets its own via thread-local storage.
 _db: kuzu.Database | None = None
-_conn: kuzu.Connection | None = None
+_tls = threading.local()
+
+# Directories already created this process - mkdir(parents=True) stats every
+# path component even when it no-ops, so remember what we have ensured.
+_ensured_dirs: set[Path] = set()
 
 
 def get_db_path() -> Path:
@@ -24,6 +37,11 @@ def get_db_path() -> Path:
 def init_database(path: Path | None = None) -> kuzu.Database:
     """Initialize or get existing database.
 
+    Kuzu's buffer pool defaults to a fraction of system RAM, which is often
+    wrong in containers or on shared hosts; set TALOS_KUZU_BUFPOOL (bytes)
+    and TALOS_KUZU_THREADS to size it explicitly for scan-heavy librarian
+    workloads.
+
     Args:
         path: Optional path to database directory. Uses default if not provided.
 
@@ -35,15 +53,33 @@ def init_database(path: Path | None = None) -> kuzu.Database:
     if _db is not None:
         return _db
 
-    db_path = path or get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    # Deferred so argparse-only script invocations and non-DB tests skip
+    # loading the Kuzu shared library entirely.
+    import kuzu
 
-    _db = kuzu.Database(str(db_path))
+    db_path = path or get_db_path()
+    if db_path.parent not in _ensured_dirs:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(db_path.parent)
+
+    db_config = {}
+    buffer_pool = os.environ.get("TALOS_KUZU_BUFPOOL")
+    if buffer_pool:
+        db_config["buffer_pool_size"] = int(buffer_pool)
+    max_threads = os.environ.get("TALOS_KUZU_THREADS")
+    if max_threads:
+        db_config["max_num_threads"] = int(max_threads)
+
+    _db = kuzu.Database(str(db_path), **db_config)
     return _db
 
 
 def get_connection(path: Path | None = None) -> kuzu.Connection:
-    """Get database connection.
+    """Get the calling thread's database connection.
+
+    All threads share one Database (and buffer pool); each thread gets its
+    own Connection so librarians can run concurrently without serializing
+    on a single shared cursor.
 
     Args:
         path: Optional path to database directory.
@@ -51,26 +87,43 @@ def get_connection(path: Path | None = None) -> kuzu.Connection:
     Returns:
         Kuzu Connection instance.
     """
-    global _conn
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        return conn
 
-    if _conn is not None:
-        return _conn
+    import kuzu
 
     db = init_database(path)
-    _conn = kuzu.Connection(db)
-    return _conn
+    _tls.conn = kuzu.Connection(db)
+    return _tls.conn
+
+
+@contextmanager
+def acquire_connection(path: Path | None = None) -> "Iterator[kuzu.Connection]":
+    """Acquire a connection scoped to a with-block.
+
+    The pool here is the thread-local map: every worker thread holds its
+    own Connection over the shared Database, so concurrent readers never
+    serialize on one cursor and nothing is constructed per acquisition.
+    Note Kuzu permits only one write transaction at a time process-wide;
+    concurrency gains apply to reads.
+    """
+    yield get_connection(path)
 
 
 def close_connection() -> None:
     """Close database connection and release file locks."""
-    global _db, _conn
+    global _db
+
+    invalidate_cache()
 
-    if _conn is not None:
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
         try:
-            _conn.close()
+            conn.close()
         except Exception:
             pass  # Connection might already be closed
-        _conn = None
+        _tls.conn = None
 
     if _db is not None:
         try:
@@ -80,16 +133,97 @@ def close_connection() -> None:
         _db = None
 
 
-def execute_query(query: str, parameters: dict | None = None) -> kuzu.QueryResult:
+@contextmanager
+def kuzu_tx(conn: "kuzu.Connection") -> "Iterator[kuzu.Connection]":
+    """Run a block of statements as one explicit transaction.
+
+    Each auto-committed execute pays its own WAL flush; wrapping a unit
+    of work in BEGIN/COMMIT pays it once for the whole block. On
+    exception the transaction rolls back, so the block is all-or-nothing.
+
+    Note a statement error inside an explicit transaction already rolls
+    it back and ends it engine-side, which is why the ROLLBACK here
+    tolerates finding no active transaction - and why statement errors
+    must propagate out of the block rather than being swallowed, lest
+    later statements silently run auto-committed outside it.
+    """
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        yield conn
+    except BaseException:
+        try:
+            conn.execute("ROLLBACK")
+        except Exception:
+            pass  # The failing statement already ended the transaction
+        raise
+    conn.execute("COMMIT")
+
+
+def fetch_rows(result: "kuzu.QueryResult") -> list[tuple]:
+    """Materialize a QueryResult as a list of row tuples.
+
+    get_all() pulls every row across the driver boundary in one call; the
+    has_next/get_next loop it replaces crossed that boundary twice per
+    row. (get_as_arrow() would be the columnar equivalent, but in Kuzu
+    0.11 it segfaults on FLOAT[N] array columns such as embeddings, so
+    the row-major bulk call is the safe fast path.)
+    """
+    return [tuple(row) for row in result.get_all()]
+
+
+@lru_cache(maxsize=256)
+def _cached_execute(query: str, params_items: tuple | None) -> list[tuple]:
+    """Execute a read-only query and materialize its rows for reuse.
+
+    QueryResults are live cursors, so cached entries hold plain tuples.
+    """
+    conn = get_connection()
+    if params_items:
+        # List parameters arrive as tuples (lru_cache keys must hash) but
+        # Kuzu only binds lists, so convert back at the boundary.
+        params = {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in params_items
+        }
+        result = conn.execute(query, params)
+    else:
+        result = conn.execute(query)
+
+    return fetch_rows(result)
+
+
+def invalidate_cache() -> None:
+    """Drop all cached query results. Call after any mutating statement."""
+    _cached_execute.cache_clear()
+
+
+def execute_query(
+    query: str, parameters: dict | None = None, cache: bool = False
+) -> "kuzu.QueryResult | list[tuple]":
     """Execute a Cypher query.
 
     Args:
         query: Cypher query string.
         parameters: Optional query parameters.
+        cache: Cache the materialized rows for repeated read-only queries.
+            Cached calls return a list of row tuples instead of a live
+            QueryResult; callers that mutate the graph must invalidate via
+            invalidate_cache().
 
     Returns:
-        Query result.
+        Query result, or a materialized list of row tuples when cached.
     """
+    if cache:
+        params_items = (
+            tuple(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in sorted(parameters.items())
+            )
+            if parameters
+            else None
+        )
+        return _cached_execute(query, params_items)
+
     conn = get_connection()
     if parameters:
         return conn.execute(query, parameters)
@@ -1,6 +1,14 @@
-"""Schema deployment for Kuzu database."""
+"""File-driven schema deployment from docs/kuzu_schema.cypher.
 
+The canonical deploy path is :mod:`talos_telemetry.db.kuzu_schema`, which is
+what ``talos_telemetry.db`` re-exports; this module exists for deploying the
+annotated schema file (indexes, seed rows) and is kept import-compatible.
+"""
+
+import pickle
+import re
 from pathlib import Path
+from typing import Iterator
 
 from talos_telemetry.db.connection import get_connection
 
@@ -12,6 +20,93 @@ def get_schema_path() -> Path:
     return package_root / "docs" / "kuzu_schema.cypher"
 
 
+# Node tables the deployed schema must contain; frozen at module scope so
+# verify_schema does not rebuild the set on every call.
+_EXPECTED_NODES: frozenset[str] = frozenset(
+    {
+        "Session",
+        "Insight",
+        "Observation",
+        "Pattern",
+        "Belief",
+        "Decision",
+        "Experience",
+        "OperationalState",
+        "Friction",
+        "Tool",
+        "Question",
+        "Sutra",
+        "Human",
+        "Goal",
+        "Capability",
+        "Limitation",
+        "Persona",
+        "Protocol",
+        "Domain",
+        "Reflection",
+    }
+)
+
+# Statement classifier: one DFA pass with named alternations instead of
+# upper-casing the statement (a full copy) and scanning it four times.
+# Group names double as the results-dict counter keys.
+_KIND_RE = re.compile(
+    r"(?P<node_tables>CREATE\s+NODE\s+TABLE)"
+    r"|(?P<rel_tables>CREATE\s+REL\s+TABLE)"
+    r"|(?P<indexes>CREATE_(?:VECTOR|FTS)_INDEX)"
+    r"|(?P<data>CREATE\s*\()",
+    re.IGNORECASE,
+)
+
+
+def _iter_statements(path: Path) -> Iterator[str]:
+    """Yield semicolon-terminated statements from the schema file.
+
+    Streams line-by-line instead of loading the whole file and holding a
+    second copy in a statement list - memory stays O(one statement).
+    """
+    buf: list[str] = []
+    with open(path) as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("--"):
+                continue
+            buf.append(line.rstrip("\n"))
+            if stripped.endswith(";"):
+                yield "\n".join(buf)
+                buf = []
+
+
+def _load_statements(path: Path) -> list[str]:
+    """Parse the schema file, reusing an on-disk cache when it is current.
+
+    The cache (a pickle next to the schema file) stores the parsed statement
+    list stamped with the source's mtime and size, so repeat deploys skip the
+    Python-level splitter entirely. Cache IO failures fall back to parsing.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = path.with_suffix(".cypher.cache")
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, statements = pickle.load(f)
+        if cached_stamp == stamp:
+            return statements
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass
+
+    statements = list(_iter_statements(path))
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((stamp, statements), f)
+    except OSError:
+        pass  # Read-only checkout - cache is an optimization, not a requirement
+
+    return statements
+
+
 def deploy_schema(schema_path: Path | None = None) -> dict:
     """Deploy schema to Kuzu database.
 
@@ -27,46 +122,39 @@ def deploy_schema(schema_path: Path | None = None) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Schema file not found: {path}")
 
-    # Read schema file
-    with open(path) as f:
-        schema_content = f.read()
-
-    # Split into individual statements
-    # Skip comments and empty lines
-    statements = []
-    current_statement = []
-
-    for line in schema_content.split("\n"):
-        stripped = line.strip()
-
-        # Skip comments and empty lines
-        if stripped.startswith("--") or not stripped:
-            continue
-
-        current_statement.append(line)
+    statements = _load_statements(path)
 
-        # Statement ends with semicolon
-        if stripped.endswith(";"):
-            statements.append("\n".join(current_statement))
-            current_statement = []
-
-    # Execute each statement
     results = {"node_tables": 0, "rel_tables": 0, "indexes": 0, "data": 0, "errors": []}
 
+    # Fast path: run the whole deploy in one explicit transaction so the WAL
+    # flushes once instead of once per statement. Any failure (including
+    # "already exists" on a rerun) aborts the transaction, so roll back and
+    # fall through to per-statement execution, which preserves idempotency.
+    try:
+        conn.execute("BEGIN TRANSACTION")
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute("COMMIT")
+    except Exception:
+        try:
+            conn.execute("ROLLBACK")
+        except Exception:
+            pass
+    else:
+        for statement in statements:
+            match = _KIND_RE.search(statement)
+            if match:
+                results[match.lastgroup] += 1
+        return results
+
     for statement in statements:
         try:
             conn.execute(statement)
 
             # Track what was created
-            upper_stmt = statement.upper()
-            if "CREATE NODE TABLE" in upper_stmt:
-                results["node_tables"] += 1
-            elif "CREATE REL TABLE" in upper_stmt:
-                results["rel_tables"] += 1
-            elif "CREATE_VECTOR_INDEX" in upper_stmt or "CREATE_FTS_INDEX" in upper_stmt:
-                results["indexes"] += 1
-            elif "CREATE (" in upper_stmt:
-                results["data"] += 1
+            match = _KIND_RE.search(statement)
+            if match:
+                results[match.lastgroup] += 1
 
         except Exception as e:
             error_msg = str(e)
@@ -82,45 +170,35 @@ def deploy_schema(schema_path: Path | None = None) -> dict:
     return results
 
 
-def verify_schema() -> dict:
+def verify_schema(include_tables: bool = False) -> dict:
     """Verify schema deployment.
 
+    Args:
+        include_tables: Also return the full show_tables() rows under
+            "tables"; off by default so the common call streams names
+            without materializing a DataFrame.
+
     Returns:
         Dict with verification results.
     """
     conn = get_connection()
 
-    # Check node tables
-    node_tables = conn.execute("CALL show_tables() RETURN *").get_as_df()
-
-    expected_nodes = [
-        "Session",
-        "Insight",
-        "Observation",
-        "Pattern",
-        "Belief",
-        "Decision",
-        "Experience",
-        "OperationalState",
-        "Friction",
-        "Tool",
-        "Question",
-        "Sutra",
-        "Human",
-        "Goal",
-        "Capability",
-        "Limitation",
-        "Persona",
-        "Protocol",
-        "Domain",
-        "Reflection",
-    ]
-
-    found_nodes = set(node_tables["name"].tolist()) if not node_tables.empty else set()
-
-    return {
-        "expected_nodes": len(expected_nodes),
-        "found_nodes": len(found_nodes & set(expected_nodes)),
-        "missing_nodes": list(set(expected_nodes) - found_nodes),
-        "tables": node_tables.to_dict("records") if not node_tables.empty else [],
+    # Stream the catalog rather than converting through pandas/arrow just
+    # to read the name column - the conversion cost dwarfs the scan.
+    result = conn.execute("CALL show_tables() RETURN *")
+    found_nodes = set()
+    tables = []
+    while result.has_next():
+        row = result.get_next()
+        found_nodes.add(row[1])
+        if include_tables:
+            tables.append(row)
+
+    verification = {
+        "expected_nodes": len(_EXPECTED_NODES),
+        "found_nodes": len(found_nodes & _EXPECTED_NODES),
+        "missing_nodes": list(_EXPECTED_NODES - found_nodes),
     }
+    if include_tables:
+        verification["tables"] = tables
+    return verification
@@ -1,6 +1,6 @@
 """Seed reference data into Kuzu database."""
 
-from talos_telemetry.db.connection import get_connection
+from talos_telemetry.db.connection import acquire_connection
 
 # Reference data definitions
 OPERATIONAL_STATES = [
@@ -88,31 +88,92 @@ TOOLS = [
 ]
 
 
+# Module-level query text so every call executes byte-identical Cypher.
+# Kuzu caches plans keyed on query text (conn.prepare is deprecated in the
+# 0.11 Python API), so one parse/plan per shape instead of one per call.
+_MERGE_STATES = """
+UNWIND $rows AS r
+MERGE (s:OperationalState {id: r.id})
+ON CREATE SET s.name = r.name, s.description = r.description, s.category = r.category
+"""
+
+_MERGE_DOMAINS = """
+UNWIND $rows AS r
+MERGE (d:Domain {id: r.id})
+ON CREATE SET d.name = r.name, d.description = r.description, d.depth = r.depth
+"""
+
+_MERGE_TOOLS = """
+UNWIND $rows AS r
+MERGE (t:Tool {id: r.id})
+ON CREATE SET t.name = r.name, t.category = r.category
+"""
+
+
+def _count_label(conn, label: str) -> int:
+    """Count nodes with the given label."""
+    return conn.execute(f"MATCH (n:{label}) RETURN count(n)").get_next()[0]
+
+
+def _bulk_copy(conn, table: str, columns: tuple[str, ...], rows: list[tuple]) -> int | None:
+    """Bulk-load rows via COPY FROM an in-memory Arrow table.
+
+    COPY goes through Kuzu's engine-level ingest path, bypassing per-row
+    transactional overhead. Returns the row count on success, or None when
+    the fast path is unavailable (pyarrow not installed) or not applicable
+    (rows already present - COPY is all-or-nothing on duplicate keys), in
+    which case the caller falls back to the row-at-a-time loop.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    # COPY requires the full column set, so the degree counter (present on
+    # every node table) rides along as zeros - reference rows have no edges
+    # at seed time.
+    arrow_data = {name: [row[i] for row in rows] for i, name in enumerate(columns)}
+    arrow_data["degree"] = [0] * len(rows)
+    arrow_table = pa.table(arrow_data)
+
+    try:
+        conn.execute(f"COPY {table} FROM $dataframe", {"dataframe": arrow_table})
+        return len(rows)
+    except Exception as e:
+        message = str(e)
+        if "duplicate" in message or "already exists" in message:
+            return None
+        raise
+
+
 def seed_operational_states() -> int:
     """Seed OperationalState reference data.
 
     Returns:
         Number of states seeded.
     """
-    conn = get_connection()
-    count = 0
-
-    for state_id, name, description, category in OPERATIONAL_STATES:
-        try:
-            conn.execute(f"""
-                CREATE (s:OperationalState {{
-                    id: '{state_id}',
-                    name: '{name}',
-                    description: '{description}',
-                    category: '{category}'
-                }})
-            """)
-            count += 1
-        except Exception as e:
-            if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                raise
-
-    return count
+    with acquire_connection() as conn:
+        copied = _bulk_copy(
+            conn,
+            "OperationalState",
+            ("id", "name", "description", "category"),
+            OPERATIONAL_STATES,
+        )
+        if copied is not None:
+            return copied
+
+        # One UNWIND batch amortizes parse/plan and commit over all rows; MERGE
+        # makes reruns idempotent server-side, so no exceptions are raised or
+        # matched on reseed. Newly created rows are the before/after count diff.
+        rows = [
+            {"id": state_id, "name": name, "description": description, "category": category}
+            for state_id, name, description, category in OPERATIONAL_STATES
+        ]
+
+        before = _count_label(conn, "OperationalState")
+        conn.execute(_MERGE_STATES, {"rows": rows})
+
+        return _count_label(conn, "OperationalState") - before
 
 
 def seed_domains() -> int:
@@ -121,25 +182,20 @@ def seed_domains() -> int:
     Returns:
         Number of domains seeded.
     """
-    conn = get_connection()
-    count = 0
-
-    for domain_id, name, description, depth in DOMAINS:
-        try:
-            conn.execute(f"""
-                CREATE (d:Domain {{
-                    id: '{domain_id}',
-                    name: '{name}',
-                    description: '{description}',
-                    depth: '{depth}'
-                }})
-            """)
-            count += 1
-        except Exception as e:
-            if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                raise
-
-    return count
+    with acquire_connection() as conn:
+        copied = _bulk_copy(conn, "Domain", ("id", "name", "description", "depth"), DOMAINS)
+        if copied is not None:
+            return copied
+
+        rows = [
+            {"id": domain_id, "name": name, "description": description, "depth": depth}
+            for domain_id, name, description, depth in DOMAINS
+        ]
+
+        before = _count_label(conn, "Domain")
+        conn.execute(_MERGE_DOMAINS, {"rows": rows})
+
+        return _count_label(conn, "Domain") - before
 
 
 def seed_tools() -> int:
@@ -148,24 +204,20 @@ def seed_tools() -> int:
     Returns:
         Number of tools seeded.
     """
-    conn = get_connection()
-    count = 0
-
-    for tool_id, name, category in TOOLS:
-        try:
-            conn.execute(f"""
-                CREATE (t:Tool {{
-                    id: '{tool_id}',
-                    name: '{name}',
-                    category: '{category}'
-                }})
-            """)
-            count += 1
-        except Exception as e:
-            if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                raise
-
-    return count
+    with acquire_connection() as conn:
+        copied = _bulk_copy(conn, "Tool", ("id", "name", "category"), TOOLS)
+        if copied is not None:
+            return copied
+
+        rows = [
+            {"id": tool_id, "name": name, "category": category}
+            for tool_id, name, category in TOOLS
+        ]
+
+        before = _count_label(conn, "Tool")
+        conn.execute(_MERGE_TOOLS, {"rows": rows})
+
+        return _count_label(conn, "Tool") - before
 
 
 def seed_reference_data() -> dict:
@@ -174,6 +226,9 @@ def seed_reference_data() -> dict:
     Returns:
         Dict with seeding results.
     """
+    # Sequential on purpose: Kuzu allows one write transaction at a time
+    # process-wide, so fanning the three seeders across threads only adds
+    # lock contention. Reads (verification) are what parallelize.
     return {
         "operational_states": seed_operational_states(),
         "domains": seed_domains(),
@@ -187,11 +242,12 @@ def verify_reference_data() -> dict:
     Returns:
         Dict with verification results.
     """
-    conn = get_connection()
-
-    state_count = conn.execute("MATCH (s:OperationalState) RETURN count(s) as count").get_next()[0]
-    domain_count = conn.execute("MATCH (d:Domain) RETURN count(d) as count").get_next()[0]
-    tool_count = conn.execute("MATCH (t:Tool) RETURN count(t) as count").get_next()[0]
+    with acquire_connection() as conn:
+        state_count = conn.execute(
+            "MATCH (s:OperationalState) RETURN count(s) as count"
+        ).get_next()[0]
+        domain_count = conn.execute("MATCH (d:Domain) RETURN count(d) as count").get_next()[0]
+        tool_count = conn.execute("MATCH (t:Tool) RETURN count(t) as count").get_next()[0]
 
     return {
         "operational_states": {"expected": len(OPERATIONAL_STATES), "found": state_count},
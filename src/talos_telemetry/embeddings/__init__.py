@@ -1,5 +1,5 @@
 """Embeddings module - sentence transformer embeddings."""
 
-from talos_telemetry.embeddings.model import get_embedding, get_model
+from talos_telemetry.embeddings.model import get_embedding, get_embedding_list, get_model
 
-__all__ = ["get_embedding", "get_model"]
+__all__ = ["get_embedding", "get_embedding_list", "get_model"]
@@ -1,6 +1,13 @@
 """Embedding model management."""
 
+import hashlib
 import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 
 import numpy as np
@@ -51,7 +58,7 @@ def get_model(model_name: str | None = None):
     return _model
 
 
-def get_embedding(text: str, model_name: str | None = None) -> list[float]:
+def get_embedding(text: str, model_name: str | None = None) -> np.ndarray:
     """Generate embedding for text.
 
     Args:
@@ -59,14 +66,41 @@ def get_embedding(text: str, model_name: str | None = None) -> list[float]:
         model_name: Optional model name.
 
     Returns:
-        List of floats (embedding vector).
+        L2-normalized float32 ndarray.
     """
+    # Cache and batcher only speak the default model; explicit model_name
+    # calls take the direct path.
+    if model_name is None:
+        digest = _digest(text)
+        cached = _cache_get(digest)
+        if cached is not None:
+            return cached
+
+        # Opt-in micro-batching (TALOS_EMBED_BATCH_MS): concurrent callers
+        # of the default model share one encode batch.
+        batcher = _get_batcher()
+        if batcher is not None:
+            vec = batcher.submit(text).result()
+        else:
+            model = get_model(None)
+            vec = np.asarray(
+                model.encode(text, convert_to_numpy=True, normalize_embeddings=True),
+                dtype=np.float32,
+            )
+        _cache_put(digest, vec)
+        return vec
+
     model = get_model(model_name)
-    embedding = model.encode(text, convert_to_numpy=True)
-    return embedding.tolist()
+    # L2-normalized at encode time so cosine similarity downstream is a
+    # single dot product; fp32 so storage never widens to fp64. Returned as
+    # ndarray - materializing 768 PyFloats per call is pure overhead when
+    # the consumer is numpy; callers that need list form for Cypher text
+    # use get_embedding_list at the boundary.
+    embedding = model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+    return np.asarray(embedding, dtype=np.float32)
 
 
-def get_embeddings(texts: list[str], model_name: str | None = None) -> list[list[float]]:
+def get_embeddings(texts: list[str], model_name: str | None = None) -> np.ndarray:
     """Generate embeddings for multiple texts.
 
     Args:
@@ -74,23 +108,376 @@ def get_embeddings(texts: list[str], model_name: str | None = None) -> list[list
         model_name: Optional model name.
 
     Returns:
-        List of embedding vectors.
+        (N, D) L2-normalized float32 ndarray.
     """
     model = get_model(model_name)
-    embeddings = model.encode(texts, convert_to_numpy=True)
-    return [e.tolist() for e in embeddings]
+    embeddings = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+# Content-addressed embedding cache: identical text skips the forward pass.
+# Two tiers - an in-process LRU of ndarrays and a sqlite store of raw fp32
+# bytes under get_cache_path(), which already holds the model weights. Keys
+# are blake2b digests so cache size is independent of text length.
+_MEM_CACHE_MAX = 4096
+_mem_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+_cache_lock = threading.Lock()
+_store: sqlite3.Connection | None = None
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _digest(text: str) -> str:
+    # Key on normalized text (strip, lowercase, collapsed whitespace) so
+    # retries and near-duplicate chunks - the same sentence re-extracted
+    # with different spacing or casing - share one cache entry instead of
+    # paying the forward pass again.
+    normalized = _WS_RE.sub(" ", text.strip().lower())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def _vector_store() -> sqlite3.Connection:
+    global _store
+    if _store is None:
+        cache_path = get_cache_path()
+        cache_path.mkdir(parents=True, exist_ok=True)
+        _store = sqlite3.connect(cache_path / "vectors.db", check_same_thread=False)
+        _store.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (digest TEXT PRIMARY KEY, vec BLOB)"
+        )
+        _store.commit()
+    return _store
+
+
+def _cache_get(digest: str) -> np.ndarray | None:
+    with _cache_lock:
+        vec = _mem_cache.get(digest)
+        if vec is not None:
+            _mem_cache.move_to_end(digest)
+            return vec
+        try:
+            row = _vector_store().execute(
+                "SELECT vec FROM vectors WHERE digest = ?", (digest,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    # frombuffer is zero-copy; the view is read-only, which also protects
+    # the cached array from mutation by callers.
+    vec = np.frombuffer(row[0], dtype=np.float32)
+    with _cache_lock:
+        _mem_cache[digest] = vec
+        if len(_mem_cache) > _MEM_CACHE_MAX:
+            _mem_cache.popitem(last=False)
+    return vec
+
+
+def _cache_put(digest: str, vec: np.ndarray) -> None:
+    vec = vec.copy()
+    vec.flags.writeable = False
+    with _cache_lock:
+        _mem_cache[digest] = vec
+        if len(_mem_cache) > _MEM_CACHE_MAX:
+            _mem_cache.popitem(last=False)
+        try:
+            _vector_store().execute(
+                "INSERT OR REPLACE INTO vectors (digest, vec) VALUES (?, ?)",
+                (digest, vec.tobytes()),
+            )
+            _vector_store().commit()
+        except sqlite3.Error:
+            pass  # Disk tier is an optimization; the LRU still serves hits
+
+
+class _EmbedBatcher:
+    """Coalesce concurrent get_embedding calls into one encode batch.
+
+    The transformer forward pass is nearly free per added row until the
+    batch tensor fills, but a batch-of-one pays the full Python-to-Torch
+    dispatch cost every call. A background worker collects requests for a
+    short window (or until max_batch) and runs one encode for all of them.
+    """
+
+    def __init__(self, window_ms: float, max_batch: int = 32):
+        self._window_s = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, Future]] = []
+        self._wake = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run, name="talos-embed-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue a text; the returned Future resolves to its embedding."""
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((text, future))
+        self._wake.set()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            # Collection window: let concurrent callers pile in.
+            time.sleep(self._window_s)
+            with self._lock:
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+                if not self._pending:
+                    self._wake.clear()
+            if not batch:
+                continue
+            texts = [text for text, _ in batch]
+            try:
+                vectors = get_embeddings(texts)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
 
+_batcher: _EmbedBatcher | None = None
+_batcher_lock = threading.Lock()
+
+
+def _get_batcher() -> _EmbedBatcher | None:
+    """Return the shared batcher when TALOS_EMBED_BATCH_MS enables it."""
+    window_ms = os.environ.get("TALOS_EMBED_BATCH_MS")
+    if not window_ms:
+        return None
+
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = _EmbedBatcher(float(window_ms))
+    return _batcher
+
+
+def get_embedding_list(text: str, model_name: str | None = None) -> list[float]:
+    """Generate embedding for text as a plain Python list.
+
+    Compatibility boundary for consumers that serialize the vector (Cypher
+    literals, JSON); numeric consumers should use get_embedding.
+    """
+    return get_embedding(text, model_name).tolist()
+
+
+# Symmetric int8 quantization scale: unit-length fp32 components lie in
+# [-1, 1], so 127 steps per side keeps the dot-product error below ~1%.
+INT8_SCALE = 1.0 / 127.0
+
+
+def quantize_embedding(vec: np.ndarray | list[float]) -> np.ndarray:
+    """Quantize a normalized embedding to int8.
+
+    Quarters the bytes moved per similarity comparison versus fp32; dequantize
+    by multiplying through INT8_SCALE (cosine_similarity_int8 does this).
+
+    Args:
+        vec: L2-normalized embedding vector.
+
+    Returns:
+        int8 array of the same length.
+    """
+    return np.round(np.asarray(vec, dtype=np.float32) * 127.0).astype(np.int8)
+
+
+def quantize_embeddings(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize a stacked (N, D) embedding matrix to int8 with per-row scales.
+
+    Unlike quantize_embedding, rows need not be unit-length: each row gets a
+    symmetric scale of max|row| / 127, so dequantization is row-exact at the
+    extremes. All-pairs cosine over the batch becomes an integer Gram matrix
+    (int32 accumulation, so D products per cell cannot overflow) multiplied
+    by the outer product of the scales - a quarter the memory traffic of the
+    fp32 matmul.
+
+    Args:
+        matrix: (N, D) float matrix of embeddings.
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+    Returns:
+        Tuple of the (N, D) int8 matrix and the (N,) float32 scale vector.
+    """
+    m = np.asarray(matrix, dtype=np.float32)
+    scale = np.abs(m).max(axis=1) / 127.0
+    scale[scale == 0.0] = 1.0  # all-zero rows quantize to zero; avoid 0/0
+    q = np.round(m / scale[:, None]).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+
+def cosine_similarity_int8(a_i8: np.ndarray, b_i8: np.ndarray) -> float:
+    """Cosine similarity between two int8-quantized normalized embeddings.
+
+    Args:
+        a_i8: First quantized vector.
+        b_i8: Second quantized vector.
+
+    Returns:
+        Cosine similarity score.
+    """
+    # Widen to int32 before the dot so 768 products cannot overflow.
+    dot = int(a_i8.astype(np.int32) @ b_i8.astype(np.int32))
+    return dot * INT8_SCALE * INT8_SCALE
+
+
+def cosine_similarity(
+    a: np.ndarray | list[float],
+    b: np.ndarray | list[float],
+    *,
+    assume_normalized: bool = False,
+) -> float:
     """Calculate cosine similarity between two vectors.
 
     Args:
         a: First vector.
         b: Second vector.
+        assume_normalized: Skip norm division when both inputs are already
+            unit-length (true for anything from get_embedding) - the whole
+            computation collapses to one BLAS dot.
 
     Returns:
         Cosine similarity score.
     """
-    a_np = np.array(a)
-    b_np = np.array(b)
-    return float(np.dot(a_np, b_np) / (np.linalg.norm(a_np) * np.linalg.norm(b_np)))
+    a_np = np.asarray(a, dtype=np.float32)
+    b_np = np.asarray(b, dtype=np.float32)
+    dot = float(a_np @ b_np)
+    if assume_normalized:
+        return dot
+    return dot / float(np.sqrt((a_np @ a_np) * (b_np @ b_np)))
+
+
+def cosine_similarity_batch(
+    queries: np.ndarray, corpus: np.ndarray, *, assume_normalized: bool = False
+) -> np.ndarray:
+    """Calculate pairwise cosine similarity for query and corpus matrices.
+
+    One matmul replaces a Python loop of per-pair dot products - the shape
+    retrieval wants when scoring one (or a few) queries against many stored
+    embeddings.
+
+    Args:
+        queries: (Q, D) query vectors.
+        corpus: (N, D) corpus vectors.
+        assume_normalized: Skip row normalization when inputs are unit-length.
+
+    Returns:
+        (Q, N) similarity matrix.
+    """
+    queries = np.asarray(queries, dtype=np.float32)
+    corpus = np.asarray(corpus, dtype=np.float32)
+    if not assume_normalized:
+        queries = queries / np.linalg.norm(queries, axis=-1, keepdims=True)
+        corpus = corpus / np.linalg.norm(corpus, axis=-1, keepdims=True)
+    return queries @ corpus.T
+
+
+# Optional numba kernel for row-paired dots: JIT-compiled native loop that
+# drops the GIL and splits rows across threads with SIMD inner loops. Falls
+# back silently to einsum (also a C loop, single-threaded) when numba is not
+# installed - install the "perf" extra to enable it.
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _pair_dots(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        out = np.empty(a.shape[0], dtype=np.float32)
+        for i in prange(a.shape[0]):
+            acc = np.float32(0.0)
+            for k in range(a.shape[1]):
+                acc += a[i, k] * b[i, k]
+            out[i] = acc
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _matvec_dots(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+        out = np.empty(matrix.shape[0], dtype=np.float32)
+        for i in prange(matrix.shape[0]):
+            acc = np.float32(0.0)
+            for k in range(matrix.shape[1]):
+                acc += matrix[i, k] * query[k]
+            out[i] = acc
+        return out
+
+    # Warm the matvec kernel at import so the first real query does not
+    # pay the JIT compile (cache=True makes this a disk hit after the
+    # first process).
+    _matvec_dots(
+        np.zeros((1, EMBEDDING_DIM), dtype=np.float32),
+        np.zeros(EMBEDDING_DIM, dtype=np.float32),
+    )
+
+except ImportError:
+    _pair_dots = None
+    _matvec_dots = None
+
+
+def topk_cosine(
+    query: np.ndarray | list[float],
+    matrix: np.ndarray,
+    k: int,
+    *,
+    assume_normalized: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the indices and scores of the k rows most similar to query.
+
+    Brute-force top-k for candidate sets scored client-side (e.g. when no
+    vector index is available): the numba kernel splits rows across
+    threads with SIMD inner loops, falling back to one BLAS matvec, and
+    argpartition selects k in O(N) instead of sorting all N scores.
+
+    Args:
+        query: (D,) query vector.
+        matrix: (N, D) candidate vectors.
+        k: Number of rows to return (capped at N).
+        assume_normalized: Skip norm division when inputs are unit-length.
+
+    Returns:
+        Tuple of (k,) index array and (k,) score array, best first.
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if not assume_normalized:
+        query = query / np.linalg.norm(query)
+        matrix = matrix / np.linalg.norm(matrix, axis=-1, keepdims=True)
+
+    scores = _matvec_dots(matrix, query) if _matvec_dots is not None else matrix @ query
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return top, scores[top]
+
+
+def cosine_similarity_pairs(
+    a: np.ndarray, b: np.ndarray, *, assume_normalized: bool = False
+) -> np.ndarray:
+    """Calculate cosine similarity between aligned row pairs of two matrices.
+
+    The elementwise sibling of cosine_similarity_batch: row i of the result
+    scores a[i] against b[i], replacing a Python loop of scalar
+    cosine_similarity calls over zipped pairs.
+
+    Args:
+        a: (N, D) vectors.
+        b: (N, D) vectors, row-aligned with a.
+        assume_normalized: Skip row normalization when inputs are unit-length.
+
+    Returns:
+        (N,) similarity vector.
+    """
+    a = np.ascontiguousarray(a, dtype=np.float32)
+    b = np.ascontiguousarray(b, dtype=np.float32)
+    if not assume_normalized:
+        a = a / np.linalg.norm(a, axis=-1, keepdims=True)
+        b = b / np.linalg.norm(b, axis=-1, keepdims=True)
+    if _pair_dots is not None:
+        return _pair_dots(a, b)
+    return np.einsum("ij,ij->i", a, b)
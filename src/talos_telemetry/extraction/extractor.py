@@ -4,16 +4,28 @@ Extracts structured entities (Insight, Pattern, Belief, etc.) from natural langu
 using OpenAI or Anthropic LLMs with structured output.
 """
 
+import functools
 import json
 import os
+import re
+import sys
 from dataclasses import dataclass
 
-# Lazy imports for LLM clients
-_openai_client = None
-_anthropic_client = None
+# orjson parses LLM responses (often many KB of nested JSON) several times
+# faster than stdlib json; fall back silently when it is not installed.
+try:
+    import orjson
 
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-@dataclass
+# Matches a whole response wrapped in ```json ... ``` or ``` ... ``` fences;
+# group 1 is the payload. One DFA scan, no intermediate substrings.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+@dataclass(slots=True)
 class ExtractedEntity:
     """An entity extracted from text."""
 
@@ -24,7 +36,7 @@ class ExtractedEntity:
     metadata: dict | None = None  # Additional extracted properties
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of entity extraction."""
 
@@ -33,6 +45,21 @@ class ExtractionResult:
     raw_response: dict | None = None  # Raw LLM response for debugging
 
 
+# The closed set of extractable entity types; _CANON resolves a
+# case-insensitive hint to its canonical spelling once instead of
+# lowercasing both sides of every comparison.
+_ENTITY_TYPES = (
+    "Insight",
+    "Observation",
+    "Pattern",
+    "Belief",
+    "Decision",
+    "Friction",
+    "Experience",
+    "Reflection",
+)
+_CANON = {t.lower(): t for t in _ENTITY_TYPES}
+
 # JSON schema for structured output
 EXTRACTION_SCHEMA = {
     "type": "object",
@@ -44,16 +71,7 @@ EXTRACTION_SCHEMA = {
                 "properties": {
                     "entity_type": {
                         "type": "string",
-                        "enum": [
-                            "Insight",
-                            "Observation",
-                            "Pattern",
-                            "Belief",
-                            "Decision",
-                            "Friction",
-                            "Experience",
-                            "Reflection",
-                        ],
+                        "enum": list(_ENTITY_TYPES),
                         "description": "The type of entity being extracted",
                     },
                     "content": {
@@ -125,37 +143,48 @@ Text to analyze:
 
 Extract entities and relationships as JSON."""
 
-
+# Provider-fixed strings hoisted so per-call work is a single .format(text=...)
+# - the Anthropic suffix is baked into the template rather than concatenated
+# onto an already-formatted prompt every request.
+_SYSTEM_OPENAI = (
+    "You extract entities from text for a knowledge graph. Always respond with valid JSON."
+)
+_SYSTEM_ANTHROPIC = (
+    "You extract entities from text for a knowledge graph. "
+    "Always respond with valid JSON only, no explanations."
+)
+_ANTHROPIC_PROMPT = EXTRACTION_PROMPT + "\n\nRespond only with valid JSON matching the schema."
+
+
+# functools.cache memoizes atomically in CPython, so concurrent first calls
+# cannot race into building (and discarding) extra clients the way the old
+# unlocked module globals could.
+@functools.cache
 def _get_openai_client():
     """Get or create OpenAI client."""
-    global _openai_client
-    if _openai_client is None:
-        try:
-            from openai import OpenAI
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("openai package not installed. Run: pip install openai")
 
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not set")
-            _openai_client = OpenAI(api_key=api_key)
-        except ImportError:
-            raise ImportError("openai package not installed. Run: pip install openai")
-    return _openai_client
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not set")
+    return OpenAI(api_key=api_key)
 
 
+@functools.cache
 def _get_anthropic_client():
     """Get or create Anthropic client."""
-    global _anthropic_client
-    if _anthropic_client is None:
-        try:
-            import anthropic
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set")
-            _anthropic_client = anthropic.Anthropic(api_key=api_key)
-        except ImportError:
-            raise ImportError("anthropic package not installed. Run: pip install anthropic")
-    return _anthropic_client
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set")
+    return anthropic.Anthropic(api_key=api_key)
 
 
 def extract_entities(
@@ -188,10 +217,7 @@ def _extract_with_openai(text: str, model: str) -> ExtractionResult:
     response = client.chat.completions.create(
         model=model,
         messages=[
-            {
-                "role": "system",
-                "content": "You extract entities from text for a knowledge graph. Always respond with valid JSON.",
-            },
+            {"role": "system", "content": _SYSTEM_OPENAI},
             {"role": "user", "content": EXTRACTION_PROMPT.format(text=text)},
         ],
         response_format={
@@ -205,7 +231,7 @@ def _extract_with_openai(text: str, model: str) -> ExtractionResult:
     if not content:
         return ExtractionResult(entities=[], relationships=[], raw_response=None)
 
-    parsed = json.loads(content)
+    parsed = _loads(content)
     return _parse_extraction_response(parsed)
 
 
@@ -217,12 +243,9 @@ def _extract_with_anthropic(text: str, model: str) -> ExtractionResult:
         model=model,
         max_tokens=2048,
         messages=[
-            {
-                "role": "user",
-                "content": f"{EXTRACTION_PROMPT.format(text=text)}\n\nRespond only with valid JSON matching the schema.",
-            }
+            {"role": "user", "content": _ANTHROPIC_PROMPT.format(text=text)}
         ],
-        system="You extract entities from text for a knowledge graph. Always respond with valid JSON only, no explanations.",
+        system=_SYSTEM_ANTHROPIC,
     )
 
     content = response.content[0].text
@@ -230,30 +253,29 @@ def _extract_with_anthropic(text: str, model: str) -> ExtractionResult:
         return ExtractionResult(entities=[], relationships=[], raw_response=None)
 
     # Parse JSON from response (may include ```json blocks)
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-    content = content.strip()
-
-    parsed = json.loads(content)
+    fenced = _FENCE_RE.match(content)
+    if fenced:
+        content = fenced.group(1)
+
+    parsed = _loads(content)
     return _parse_extraction_response(parsed)
 
 
 def _parse_extraction_response(data: dict) -> ExtractionResult:
     """Parse raw extraction response into structured result."""
-    entities = []
-    for e in data.get("entities", []):
-        entities.append(
-            ExtractedEntity(
-                entity_type=e.get("entity_type", "Observation"),
-                content=e.get("content", ""),
-                confidence=e.get("confidence", 0.5),
-                domain=e.get("domain"),
-                metadata=e.get("metadata"),
-            )
+    # entity_type/content/confidence are required by EXTRACTION_SCHEMA, so
+    # index them directly; only the optional fields go through .get().
+    entities = [
+        ExtractedEntity(
+            # Interned so downstream equality checks are pointer comparisons.
+            entity_type=sys.intern(e["entity_type"]),
+            content=e["content"],
+            confidence=e["confidence"],
+            domain=e.get("domain"),
+            metadata=e.get("metadata"),
         )
+        for e in data.get("entities", ())
+    ]
 
     relationships = data.get("relationships", [])
 
@@ -283,11 +305,17 @@ def extract_single_entity(
     if not result.entities:
         return None
 
-    # If hint provided, prefer matching type
-    if hint_type:
-        for entity in result.entities:
-            if entity.entity_type.lower() == hint_type.lower():
-                return entity
-
-    # Return highest confidence entity
-    return max(result.entities, key=lambda e: e.confidence)
+    # One pass tracks both the first hint-type match and the overall
+    # highest-confidence entity; the hint wins when it matched. The hint is
+    # resolved to canonical spelling once, so the loop compares interned
+    # strings instead of lowercasing per entity.
+    target = _CANON.get(hint_type.lower()) if hint_type else None
+    best = None
+    best_typed = None
+    for entity in result.entities:
+        if target and best_typed is None and entity.entity_type == target:
+            best_typed = entity
+        if best is None or entity.confidence > best.confidence:
+            best = entity
+
+    return best_typed or best
@@ -6,8 +6,34 @@ The Three Librarians:
 - Pathfinder (Navigator): Maps pathways and optimizes retrieval
 """
 
-from talos_telemetry.librarians.pathfinder import Pathfinder
-from talos_telemetry.librarians.protector import Protector
-from talos_telemetry.librarians.synthesizer import Synthesizer
+import importlib
 
-__all__ = ["Synthesizer", "Protector", "Pathfinder"]
+# PEP 562 lazy loading: each librarian submodule pulls in the embedding
+# stack, so importing the package stays cheap until a class is touched -
+# entrypoints that run a single librarian never load the other two.
+_LAZY = {
+    "Synthesizer": "talos_telemetry.librarians.synthesizer",
+    "SynthesizerResult": "talos_telemetry.librarians.synthesizer",
+    "Protector": "talos_telemetry.librarians.protector",
+    "ProtectorResult": "talos_telemetry.librarians.protector",
+    "Pathfinder": "talos_telemetry.librarians.pathfinder",
+    "PathfinderResult": "talos_telemetry.librarians.pathfinder",
+}
+
+__all__ = (
+    "Synthesizer",
+    "SynthesizerResult",
+    "Protector",
+    "ProtectorResult",
+    "Pathfinder",
+    "PathfinderResult",
+)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj  # Cache so __getattr__ runs once per name
+    return obj
@@ -1,9 +1,62 @@
 """The Protector (Guardian) - protects integrity and prunes entropy."""
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
-
-from talos_telemetry.db.connection import get_connection
+from functools import cache
+
+from talos_telemetry.db.connection import (
+    execute_query,
+    fetch_rows,
+    get_connection,
+    invalidate_cache,
+)
+from talos_telemetry.db.kuzu_schema import REL_TABLES
+
+
+@cache
+def _redirect_queries(label: str) -> tuple[str, ...]:
+    """Build the relationship-redirect statements for merging two nodes.
+
+    Cypher cannot create an edge whose type comes from type(r), so each rel
+    table touching the label gets its own parameterized statement, generated
+    from the declarative schema (including property copies) and cached per
+    label. Guards on self-referencing tables stop a redirect from producing
+    keep->keep loops.
+    """
+    queries = []
+    for name, src, dst, props in REL_TABLES:
+        columns = [prop.split()[0] for prop in props]
+        prop_map = ", ".join(f"{col}: r.{col}" for col in columns)
+        props_clause = f" {{{prop_map}}}" if prop_map else ""
+
+        if src == label:
+            guard = "WHERE target.id <> $keep " if dst == label else ""
+            queries.append(
+                f"MATCH (e:{label} {{id: $remove}})-[r:{name}]->(target), "
+                f"(keep:{label} {{id: $keep}}) "
+                f"{guard}CREATE (keep)-[:{name}{props_clause}]->(target) DELETE r"
+            )
+        if dst == label:
+            guard = "WHERE source.id <> $keep " if src == label else ""
+            queries.append(
+                f"MATCH (source)-[r:{name}]->(e:{label} {{id: $remove}}), "
+                f"(keep:{label} {{id: $keep}}) "
+                f"{guard}CREATE (source)-[:{name}{props_clause}]->(keep) DELETE r"
+            )
+    return tuple(queries)
+
+
+@dataclass(frozen=True, slots=True)
+class ProtectorResult:
+    """Results of one Protector pass."""
+
+    duplicates_merged: int
+    stale_questions_marked: int
+    sessions_archived: int
+    orphan_nodes: list[dict]
+    entities_pruned: int
+    report: list[str] = field(default_factory=list)
+    success: bool = True
 
 
 class Protector:
@@ -27,96 +80,110 @@ class Protector:
         self.conn = get_connection()
         self.report = []
 
-    def run(self) -> dict[str, Any]:
+    def run(self) -> ProtectorResult:
         """Run the protector.
 
         Returns:
-            Dict with protection results.
+            ProtectorResult with protection results.
         """
         self.report = []
 
-        # Run protection tasks
+        # Read-only queries below go through execute_query(cache=True);
+        # mutating tasks invalidate after writing so later reads never see
+        # stale rows. Start cold in case another librarian wrote since the
+        # last pass.
+        invalidate_cache()
+
+        # Run protection tasks. Sequential on purpose, unlike Pathfinder's
+        # pooled reads: every task here writes, and Kuzu allows one write
+        # transaction at a time process-wide, so overlapping them only
+        # trades latency for conflict exceptions.
         duplicates = self._deduplicate_entities()
         stale_questions = self._mark_stale_questions()
         archived = self._archive_old_sessions()
         orphans = self._find_orphan_nodes()
         pruned = self._prune_low_value_entities()
 
-        return {
-            "success": True,
-            "duplicates_merged": duplicates,
-            "stale_questions_marked": stale_questions,
-            "sessions_archived": archived,
-            "orphan_nodes": orphans,
-            "entities_pruned": pruned,
-            "report": self.report,
-        }
+        return ProtectorResult(
+            duplicates_merged=duplicates,
+            stale_questions_marked=stale_questions,
+            sessions_archived=archived,
+            orphan_nodes=orphans,
+            entities_pruned=pruned,
+            report=self.report,
+        )
 
     def _deduplicate_entities(self) -> int:
-        """Find and merge duplicate entities."""
-        merged = 0
-
-        # Check for duplicate Beliefs (same content)
-        try:
-            result = self.conn.execute("""
-                MATCH (b1:Belief), (b2:Belief)
-                WHERE b1.id < b2.id
-                AND b1.content = b2.content
-                RETURN b1.id, b2.id
-            """)
-
-            while result.has_next():
-                row = result.get_next()
-                self._merge_entities("Belief", row[0], row[1])
-                merged += 1
-                self.report.append(f"Merged duplicate beliefs: {row[0]}, {row[1]}")
-
-        except Exception as e:
-            self.report.append(f"Error deduplicating beliefs: {e}")
+        """Find and merge duplicate entities.
 
-        # Check for duplicate Insights
-        try:
-            result = self.conn.execute("""
-                MATCH (i1:Insight), (i2:Insight)
-                WHERE i1.id < i2.id
-                AND i1.content = i2.content
-                RETURN i1.id, i2.id
-            """)
-
-            while result.has_next():
-                row = result.get_next()
-                self._merge_entities("Insight", row[0], row[1])
-                merged += 1
-                self.report.append(f"Merged duplicate insights: {row[0]}, {row[1]}")
+        Duplicates are found with a single hash-aggregate pass per label
+        (group by content, keep groups larger than one) instead of the old
+        Cartesian self-join, which was quadratic in the entity count.
+        """
+        merged = 0
 
-        except Exception as e:
-            self.report.append(f"Error deduplicating insights: {e}")
+        for label, plural in (("Belief", "beliefs"), ("Insight", "insights")):
+            try:
+                rows = execute_query(
+                    f"""
+                    MATCH (e:{label})
+                    WITH e.content AS content, collect(e.id) AS ids
+                    WHERE size(ids) > 1
+                    RETURN ids
+                    """,
+                    cache=True,
+                )
+
+                for row in rows:
+                    ids = sorted(row[0])
+                    keep = ids[0]
+                    for remove in ids[1:]:
+                        self._merge_entities(label, keep, remove)
+                        merged += 1
+                        self.report.append(f"Merged duplicate {plural}: {keep}, {remove}")
+
+            except Exception as e:
+                self.report.append(f"Error deduplicating {plural}: {e}")
 
         return merged
 
+    # Labels _merge_entities may be asked to merge. Cypher cannot
+    # parameterize labels, so the label is validated here and templated;
+    # everything else binds as parameters.
+    _MERGEABLE_LABELS = frozenset({"Belief", "Insight"})
+
     def _merge_entities(self, entity_type: str, keep_id: str, remove_id: str) -> None:
         """Merge two entities, keeping the first and removing the second."""
+        if entity_type not in self._MERGEABLE_LABELS:
+            self.report.append(f"Refusing to merge unknown label: {entity_type}")
+            return
+
         try:
-            # Redirect all relationships to the kept entity
-            self.conn.execute(f"""
-                MATCH (e:{entity_type} {{id: '{remove_id}'}})-[r]->(target)
-                MATCH (keep:{entity_type} {{id: '{keep_id}'}})
-                CREATE (keep)-[r2:{{type(r)}}]->(target)
-                DELETE r
-            """)
-
-            self.conn.execute(f"""
-                MATCH (source)-[r]->(e:{entity_type} {{id: '{remove_id}'}})
-                MATCH (keep:{entity_type} {{id: '{keep_id}'}})
-                CREATE (source)-[r2:{{type(r)}}]->(keep)
-                DELETE r
-            """)
+            # Redirect all relationships to the kept entity, one statement
+            # per rel table. The old untyped form interpolated {type(r)} as a
+            # relationship type, which is not valid Cypher - every merge
+            # raised and the bare except hid it, so dedup never deleted
+            # anything.
+            params = {"remove": remove_id, "keep": keep_id}
+            for query in _redirect_queries(entity_type):
+                self.conn.execute(query, params)
 
             # Delete the duplicate
-            self.conn.execute(f"""
-                MATCH (e:{entity_type} {{id: '{remove_id}'}})
-                DELETE e
-            """)
+            self.conn.execute(
+                f"MATCH (e:{entity_type} {{id: $remove}}) DELETE e",
+                {"remove": remove_id},
+            )
+
+            # Redirects changed the kept node's edge count in ways the
+            # self-loop guards make hard to track incrementally, so recount
+            # its relationships exactly.
+            self.conn.execute(
+                f"MATCH (keep:{entity_type} {{id: $keep}}) "
+                f"OPTIONAL MATCH (keep)-[r]-() "
+                f"WITH keep, count(r) AS d SET keep.degree = d",
+                {"keep": keep_id},
+            )
+            invalidate_cache()
 
         except Exception as e:
             self.report.append(f"Error merging entities: {e}")
@@ -128,19 +195,25 @@ class Protector:
         try:
             cutoff = datetime.now() - timedelta(days=self.QUESTION_STALE_DAYS)
 
-            result = self.conn.execute(f"""
+            # timestamp($cutoff): Kuzu has no datetime() function, so the old
+            # interpolated form raised on every run and marked nothing.
+            result = self.conn.execute(
+                """
                 MATCH (q:Question)
                 WHERE q.resolved_at IS NULL
-                AND q.raised_at < datetime('{cutoff.isoformat()}')
+                AND q.raised_at < timestamp($cutoff)
                 AND (q.urgency IS NULL OR q.urgency <> 'abandoned')
                 SET q.urgency = 'abandoned'
                 RETURN count(q) as count
-            """)
+                """,
+                {"cutoff": cutoff.isoformat()},
+            )
 
             row = result.get_next()
             marked = row[0] if row else 0
 
             if marked > 0:
+                invalidate_cache()
                 self.report.append(f"Marked {marked} questions as abandoned")
 
         except Exception as e:
@@ -157,19 +230,23 @@ class Protector:
 
             # Just mark sessions as archived for now
             # Actual cold storage migration would be separate
-            result = self.conn.execute(f"""
+            result = self.conn.execute(
+                """
                 MATCH (s:Session)
                 WHERE s.ended_at IS NOT NULL
-                AND s.ended_at < datetime('{cutoff.isoformat()}')
+                AND s.ended_at < timestamp($cutoff)
                 AND (s.archived IS NULL OR s.archived = false)
                 SET s.archived = true
                 RETURN count(s) as count
-            """)
+                """,
+                {"cutoff": cutoff.isoformat()},
+            )
 
             row = result.get_next()
             archived = row[0] if row else 0
 
             if archived > 0:
+                invalidate_cache()
                 self.report.append(f"Archived {archived} old sessions")
 
         except Exception as e:
@@ -185,17 +262,19 @@ class Protector:
 
         for entity_type in entity_types:
             try:
-                result = self.conn.execute(f"""
+                rows = execute_query(
+                    f"""
                     MATCH (e:{entity_type})
                     WHERE NOT EXISTS {{
                         MATCH (e)-[]-()
                     }}
                     RETURN e.id, e.content
                     LIMIT 10
-                """)
+                    """,
+                    cache=True,
+                )
 
-                while result.has_next():
-                    row = result.get_next()
+                for row in rows:
                     orphans.append(
                         {
                             "type": entity_type,
@@ -220,30 +299,45 @@ class Protector:
             cutoff = datetime.now() - timedelta(days=self.OBSERVATION_MAX_AGE_DAYS)
 
             # Find old observations that never crystallized
-            result = self.conn.execute(f"""
+            result = self.conn.execute(
+                """
                 MATCH (o:Observation)
-                WHERE o.observed_at < datetime('{cutoff.isoformat()}')
-                AND NOT EXISTS {{
-                    MATCH (o)-[:MERGED_INTO|CRYSTALLIZED_INTO]->()
-                }}
+                WHERE o.observed_at < timestamp($cutoff)
+                AND NOT EXISTS {
+                    MATCH (o)-[:MERGED_INTO|OBSERVATION_CRYSTALLIZED_INTO]->()
+                }
                 RETURN o.id
-            """)
-
-            to_delete = []
-            while result.has_next():
-                row = result.get_next()
-                to_delete.append(row[0])
-
-            # Delete orphaned observations
-            for obs_id in to_delete[:50]:  # Limit to 50 per run
-                try:
-                    self.conn.execute(f"""
-                        MATCH (o:Observation {{id: '{obs_id}'}})
-                        DETACH DELETE o
-                    """)
-                    pruned += 1
-                except Exception:
-                    pass
+                """,
+                {"cutoff": cutoff.isoformat()},
+            )
+
+            to_delete = [row[0] for row in fetch_rows(result)]
+
+            # Delete orphaned observations: one UNWIND batch replaces up to
+            # 50 separate DETACH DELETE statements (limit of 50 per run).
+            if to_delete:
+                # Decrement surviving neighbours' degree counters before the
+                # edges go away, aggregated per neighbour so shared ones get
+                # a single SET with the full count.
+                self.conn.execute(
+                    """
+                    UNWIND $ids AS oid
+                    MATCH (o:Observation {id: oid})-[r]-(n)
+                    WITH n, count(r) AS c
+                    SET n.degree = coalesce(n.degree, 0) - c
+                    """,
+                    {"ids": to_delete[:50]},
+                )
+                self.conn.execute(
+                    """
+                    UNWIND $ids AS oid
+                    MATCH (o:Observation {id: oid})
+                    DETACH DELETE o
+                    """,
+                    {"ids": to_delete[:50]},
+                )
+                invalidate_cache()
+                pruned = len(to_delete[:50])
 
             if pruned > 0:
                 self.report.append(f"Pruned {pruned} stale observations")
@@ -1,11 +1,56 @@
 """The Synthesizer (Alchemist) - consolidates and synthesizes understanding."""
 
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
 from uuid import uuid4
 
-from talos_telemetry.db.connection import get_connection
-from talos_telemetry.embeddings.model import cosine_similarity, get_embedding
+import numpy as np
+
+from talos_telemetry.db.connection import fetch_rows, get_connection
+from talos_telemetry.db.kuzu_schema import ensure_vector_index
+from talos_telemetry.embeddings.model import (
+    cosine_similarity,
+    get_embedding_list,
+    get_embeddings,
+    quantize_embeddings,
+)
+
+
+# Candidate queries for consolidation, as module constants so reruns hit
+# Kuzu's text-keyed plan cache. Both exclude observations that already
+# merged or crystallized - the old query refetched those every pass. The
+# delta variant additionally clips to observations that aged into the
+# window since the last checkpointed run.
+_CONSOLIDATION_FULL = """
+MATCH (o:Observation)
+WHERE o.observed_at < timestamp($cutoff)
+AND NOT EXISTS {
+    MATCH (o)-[:MERGED_INTO|OBSERVATION_CRYSTALLIZED_INTO]->()
+}
+RETURN o.id, o.content, o.embedding, o.domain
+"""
+
+_CONSOLIDATION_DELTA = """
+MATCH (o:Observation)
+WHERE o.observed_at < timestamp($cutoff)
+AND o.observed_at > timestamp($last_run)
+AND NOT EXISTS {
+    MATCH (o)-[:MERGED_INTO|OBSERVATION_CRYSTALLIZED_INTO]->()
+}
+RETURN o.id, o.content, o.embedding, o.domain
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SynthesizerResult:
+    """Results of one Synthesizer pass."""
+
+    consolidated_observations: int
+    patterns_detected: int
+    cross_domain_connections: int
+    report: list[str] = field(default_factory=list)
+    success: bool = True
 
 
 class Synthesizer:
@@ -27,52 +72,98 @@ class Synthesizer:
         self.conn = get_connection()
         self.report = []
 
-    def run(self) -> dict[str, Any]:
+    # How much the observation set may grow since the last checkpoint
+    # before a delta pass stops paying off and a full pass runs instead.
+    FULL_REBUILD_GROWTH_FACTOR = 1.5
+
+    def run(self, force: bool = False) -> SynthesizerResult:
         """Run the synthesizer.
 
+        Args:
+            force: Consolidate the full observation window instead of only
+                the delta since the last checkpointed run.
+
         Returns:
-            Dict with synthesis results.
+            SynthesizerResult with synthesis results.
         """
         self.report = []
 
         # Run synthesis tasks
-        consolidated = self._consolidate_observations()
+        consolidated = self._consolidate_observations(force=force)
         patterns = self._detect_emerging_patterns()
         connections = self._surface_cross_domain_connections()
 
-        return {
-            "success": True,
-            "consolidated_observations": consolidated,
-            "patterns_detected": patterns,
-            "cross_domain_connections": connections,
-            "report": self.report,
-        }
+        return SynthesizerResult(
+            consolidated_observations=consolidated,
+            patterns_detected=patterns,
+            cross_domain_connections=connections,
+            report=self.report,
+        )
 
-    def _consolidate_observations(self) -> int:
-        """Consolidate similar observations into insights."""
+    def _read_checkpoint(self) -> tuple[datetime | None, int]:
+        """Read the consolidation checkpoint from the singleton state node."""
+        try:
+            result = self.conn.execute(
+                "MATCH (st:SynthesizerState {id: 'synthesizer'}) "
+                "RETURN st.last_run_at, st.observation_count"
+            )
+            if result.has_next():
+                last_run_at, count = result.get_next()
+                return last_run_at, count or 0
+        except Exception:
+            pass
+        return None, 0
+
+    def _write_checkpoint(self, run_at: datetime, observation_count: int) -> None:
+        """Persist the consolidation checkpoint after a successful pass."""
+        self.conn.execute(
+            "MERGE (st:SynthesizerState {id: 'synthesizer'}) "
+            "SET st.last_run_at = timestamp($ts), st.observation_count = $count",
+            {"ts": run_at.isoformat(), "count": observation_count},
+        )
+
+    def _consolidate_observations(self, force: bool = False) -> int:
+        """Consolidate similar observations into insights.
+
+        Incremental by default: only observations that aged into the
+        window since the checkpointed previous run are fetched and grouped,
+        so steady-state passes touch the delta instead of re-embedding the
+        whole backlog. A full pass runs on the first invocation, when
+        forced, or when the observation set grew past
+        FULL_REBUILD_GROWTH_FACTOR since the checkpoint (a delta that large
+        would miss most cross-delta groupings anyway).
+        """
         consolidated = 0
 
         try:
             # Find old observations
-            cutoff = datetime.now() - timedelta(days=self.OBSERVATION_AGE_THRESHOLD)
-
-            result = self.conn.execute(f"""
-                MATCH (o:Observation)
-                WHERE o.observed_at < datetime('{cutoff.isoformat()}')
-                RETURN o.id, o.content, o.embedding, o.domain
-            """)
-
-            observations = []
-            while result.has_next():
-                row = result.get_next()
-                observations.append(
-                    {
-                        "id": row[0],
-                        "content": row[1],
-                        "embedding": row[2],
-                        "domain": row[3],
-                    }
-                )
+            now = datetime.now()
+            cutoff = now - timedelta(days=self.OBSERVATION_AGE_THRESHOLD)
+
+            last_run_at, last_count = self._read_checkpoint()
+            current_count = self.conn.execute(
+                "MATCH (o:Observation) RETURN count(o)"
+            ).get_next()[0]
+            if last_count and current_count > last_count * self.FULL_REBUILD_GROWTH_FACTOR:
+                force = True
+
+            # timestamp($cutoff): Kuzu has no datetime() function, so the old
+            # interpolated form raised on every run and consolidated nothing.
+            params = {"cutoff": cutoff.isoformat()}
+            if last_run_at is not None and not force:
+                # Anything older than the previous run's window boundary was
+                # already considered; the edge filter in the query catches
+                # what actually merged.
+                window = last_run_at - timedelta(days=self.OBSERVATION_AGE_THRESHOLD)
+                params["last_run"] = window.isoformat()
+                result = self.conn.execute(_CONSOLIDATION_DELTA, params)
+            else:
+                result = self.conn.execute(_CONSOLIDATION_FULL, params)
+
+            observations = [
+                {"id": row[0], "content": row[1], "embedding": row[2], "domain": row[3]}
+                for row in fetch_rows(result)
+            ]
 
             # Group similar observations
             groups = self._group_by_similarity(observations)
@@ -83,40 +174,56 @@ class Synthesizer:
                     consolidated += len(group)
                     self.report.append(f"Merged {len(group)} observations into insight")
 
+            self._write_checkpoint(now, current_count)
+
         except Exception as e:
             self.report.append(f"Error consolidating observations: {e}")
 
         return consolidated
 
     def _group_by_similarity(self, observations: list[dict]) -> list[list[dict]]:
-        """Group observations by embedding similarity."""
-        if not observations:
+        """Group observations by embedding similarity.
+
+        All pairwise similarities come from one matmul over the stacked,
+        int8-quantized embedding matrix rather than N^2 Python-level dot
+        products: the Gram matrix accumulates in int32 (quarter the memory
+        traffic of fp32, and the dtype VNNI-class hardware vectorizes) and
+        the per-row scales fix the result back up to cosine. Quantization
+        error is well under the 0.85 threshold's margin. Similar pairs from
+        the upper triangle are then merged with union-find.
+        """
+        embedded = [o for o in observations if o["embedding"]]
+        if len(embedded) < 2:
             return []
 
-        groups = []
-        used = set()
+        matrix = np.asarray([o["embedding"] for o in embedded], dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        quantized, scale = quantize_embeddings(matrix)
+        similarities = (quantized.astype(np.int32) @ quantized.astype(np.int32).T).astype(
+            np.float32
+        )
+        similarities *= np.outer(scale, scale)
 
-        for i, obs1 in enumerate(observations):
-            if obs1["id"] in used:
-                continue
+        pairs = np.argwhere(np.triu(similarities >= self.SIMILARITY_THRESHOLD, k=1))
 
-            group = [obs1]
-            used.add(obs1["id"])
+        parent = list(range(len(embedded)))
 
-            for j, obs2 in enumerate(observations[i + 1 :], i + 1):
-                if obs2["id"] in used:
-                    continue
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
 
-                if obs1["embedding"] and obs2["embedding"]:
-                    similarity = cosine_similarity(obs1["embedding"], obs2["embedding"])
-                    if similarity >= self.SIMILARITY_THRESHOLD:
-                        group.append(obs2)
-                        used.add(obs2["id"])
+        for i, j in pairs:
+            root_i, root_j = find(int(i)), find(int(j))
+            if root_i != root_j:
+                parent[root_j] = root_i
 
-            if len(group) > 1:
-                groups.append(group)
+        clusters: dict[int, list[dict]] = {}
+        for idx, obs in enumerate(embedded):
+            clusters.setdefault(find(idx), []).append(obs)
 
-        return groups
+        return [group for group in clusters.values() if len(group) > 1]
 
     def _merge_into_insight(self, observations: list[dict]) -> str:
         """Merge observations into a single insight."""
@@ -131,29 +238,51 @@ class Synthesizer:
 
         # Create insight
         insight_id = f"insight-synthesized-{uuid4().hex[:8]}"
-        embedding = get_embedding(combined_content)
-
-        self.conn.execute(f"""
-            CREATE (i:Insight {{
-                id: '{insight_id}',
-                content: '{_escape(combined_content)}',
-                created_at: timestamp(),
-                domain: '{domain}',
+        embedding = get_embedding_list(combined_content)
+
+        self.conn.execute(
+            """
+            CREATE (i:Insight {
+                id: $id,
+                content: $content,
+                created_at: timestamp($ts),
+                domain: $domain,
                 confidence: 0.7,
-                embedding: {embedding}
-            }})
-        """)
-
-        # Create MERGED_INTO relationships
-        for obs in observations:
-            try:
-                self.conn.execute(f"""
-                    MATCH (o:Observation {{id: '{obs["id"]}'}})
-                    MATCH (i:Insight {{id: '{insight_id}'}})
-                    CREATE (o)-[:MERGED_INTO {{merged_at: timestamp()}}]->(i)
-                """)
-            except Exception:
-                pass
+                embedding: $embedding,
+                degree: $degree
+            })
+            """,
+            {
+                "id": insight_id,
+                "content": combined_content,
+                "ts": datetime.now().isoformat(),
+                "domain": domain,
+                "embedding": embedding,
+                "degree": len(observations),
+            },
+        )
+
+        # One UNWIND batch creates every MERGED_INTO edge instead of one
+        # round-trip (parse, plan, commit) per observation. Each observation
+        # id is unique in the batch, so the per-row degree bump is safe; the
+        # insight's degree was seeded with the batch size at creation.
+        try:
+            self.conn.execute(
+                """
+                UNWIND $ids AS oid
+                MATCH (o:Observation {id: oid})
+                MATCH (i:Insight {id: $iid})
+                CREATE (o)-[:MERGED_INTO {merged_at: timestamp($ts)}]->(i)
+                SET o.degree = coalesce(o.degree, 0) + 1
+                """,
+                {
+                    "ids": [o["id"] for o in observations],
+                    "iid": insight_id,
+                    "ts": datetime.now().isoformat(),
+                },
+            )
+        except Exception:
+            pass
 
         return insight_id
 
@@ -167,101 +296,170 @@ class Synthesizer:
                 MATCH (f:Friction)
                 WHERE f.recurrence_count >= 3
                 AND NOT EXISTS {
-                    MATCH (f)-[:MANIFESTATION_OF]->(:Pattern)
+                    MATCH (f)-[:FRICTION_MANIFESTATION_OF]->(:Pattern)
                 }
-                RETURN f.id, f.description, f.category, f.recurrence_count
+                RETURN f.id, f.description, f.category, f.recurrence_count, f.embedding
             """)
 
-            while result.has_next():
-                row = result.get_next()
-                pattern_id = self._create_pattern_from_friction(row[0], row[1], row[2], row[3])
-                if pattern_id:
-                    patterns_created += 1
-                    self.report.append(f"Created pattern from recurring friction: {row[1][:50]}")
+            patterns_created = self._create_patterns_from_friction(fetch_rows(result))
 
         except Exception as e:
             self.report.append(f"Error detecting patterns: {e}")
 
         return patterns_created
 
-    def _create_pattern_from_friction(
-        self, friction_id: str, description: str, category: str, count: int
-    ) -> str:
-        """Create a pattern from recurring friction."""
-        pattern_id = f"pattern-from-friction-{uuid4().hex[:8]}"
-        embedding = get_embedding(description)
+    def _create_patterns_from_friction(self, rows: list) -> int:
+        """Create patterns from recurring friction, one batch for all rows.
+
+        Descriptions are embedded in one model forward pass, and a single
+        UNWIND statement creates every Pattern node plus its
+        FRICTION_MANIFESTATION_OF link - one round-trip total instead of two
+        executes per friction. The old per-row form also interpolated values
+        (with bare timestamp(), which Kuzu rejects) and linked through
+        MANIFESTATION_OF, a rel table that does not exist, so no pattern was
+        ever created.
+        """
+        if not rows:
+            return 0
+
+        # The pattern embeds the friction's own description, so a friction
+        # that already carries an embedding hands its vector over without a
+        # model forward pass - typically the largest per-row cost here.
+        # Only the gaps are encoded, in one batch.
+        missing = [i for i, row in enumerate(rows) if row[4] is None]
+        computed = iter(get_embeddings([rows[i][1] for i in missing])) if missing else iter(())
+        embeddings = [
+            list(row[4]) if row[4] is not None else next(computed).tolist() for row in rows
+        ]
+
+        patterns = [
+            {
+                "fid": friction_id,
+                "pid": f"pattern-from-friction-{uuid4().hex[:8]}",
+                "name": f"Recurring {category} friction",
+                "description": description,
+                "count": count,
+                "embedding": embedding,
+            }
+            for (friction_id, description, category, count, _), embedding in zip(rows, embeddings)
+        ]
 
         try:
-            self.conn.execute(f"""
-                CREATE (p:Pattern {{
-                    id: '{pattern_id}',
-                    name: 'Recurring {category} friction',
-                    description: '{_escape(description)}',
-                    first_noticed: timestamp(),
-                    occurrence_count: {count},
+            self.conn.execute(
+                """
+                UNWIND $patterns AS row
+                MATCH (f:Friction {id: row.fid})
+                CREATE (p:Pattern {
+                    id: row.pid,
+                    name: row.name,
+                    description: row.description,
+                    first_noticed: timestamp($ts),
+                    occurrence_count: row.count,
                     status: 'emerging',
-                    embedding: {embedding}
-                }})
-            """)
+                    embedding: row.embedding,
+                    degree: 1
+                })
+                CREATE (f)-[:FRICTION_MANIFESTATION_OF {valid_from: timestamp($ts)}]->(p)
+                SET f.degree = coalesce(f.degree, 0) + 1
+                """,
+                {"patterns": patterns, "ts": datetime.now().isoformat()},
+            )
 
-            # Link friction to pattern
-            self.conn.execute(f"""
-                MATCH (f:Friction {{id: '{friction_id}'}})
-                MATCH (p:Pattern {{id: '{pattern_id}'}})
-                CREATE (f)-[:MANIFESTATION_OF {{valid_from: timestamp()}}]->(p)
-            """)
+        except Exception:
+            return 0
 
-            return pattern_id
+        for pattern in patterns:
+            self.report.append(
+                f"Created pattern from recurring friction: {pattern['description'][:50]}"
+            )
+        return len(patterns)
 
-        except Exception:
-            return ""
+    def _ensure_insight_vector_index(self) -> None:
+        """Create the HNSW index on Insight.embedding if it is missing."""
+        ensure_vector_index(self.conn, "Insight", "insight_embedding_idx")
 
     def _surface_cross_domain_connections(self) -> int:
-        """Surface connections across domains."""
+        """Surface connections across domains.
+
+        Per source insight, an HNSW probe returns the nearest neighbours and
+        the graph filter keeps other-domain, not-yet-linked hits - sub-linear
+        lookups instead of the old Cartesian self-join scored pair-by-pair in
+        Python.
+        """
         connections = 0
 
         try:
-            # Find insights in different domains with high similarity
-            result = self.conn.execute("""
-                MATCH (i1:Insight)-[:OPERATES_IN]->(d1:Domain)
-                MATCH (i2:Insight)-[:OPERATES_IN]->(d2:Domain)
-                WHERE d1 <> d2
-                AND NOT EXISTS {
-                    MATCH (i1)-[:LED_TO|EVOLVED_FROM]-(i2)
-                }
-                RETURN i1.id, i1.embedding, d1.name, i2.id, i2.embedding, d2.name
+            self._ensure_insight_vector_index()
+
+            sources = self.conn.execute("""
+                MATCH (i1:Insight)-[:INSIGHT_OPERATES_IN]->(d1:Domain)
+                WHERE i1.embedding IS NOT NULL
+                RETURN i1.id, i1.embedding, d1.name
                 LIMIT 100
             """)
 
             pairs_to_connect = []
-            while result.has_next():
-                row = result.get_next()
-                if row[1] and row[4]:  # Both have embeddings
-                    similarity = cosine_similarity(row[1], row[4])
-                    if similarity >= 0.8:
-                        pairs_to_connect.append((row[0], row[3], similarity))
-
-            # Create LED_TO relationships for similar cross-domain insights
-            for id1, id2, similarity in pairs_to_connect[:10]:  # Limit to 10
-                try:
-                    self.conn.execute(f"""
-                        MATCH (i1:Insight {{id: '{id1}'}})
-                        MATCH (i2:Insight {{id: '{id2}'}})
-                        CREATE (i1)-[:LED_TO {{
-                            valid_from: timestamp(),
-                            contribution: 'contextual'
-                        }}]->(i2)
-                    """)
-                    connections += 1
-                except Exception:
-                    pass
+            seen: set[tuple[str, str]] = set()
+            for insight_id, embedding, domain in fetch_rows(sources):
+                if len(pairs_to_connect) >= 10:
+                    break
+
+                neighbors = self.conn.execute(
+                    """
+                    CALL QUERY_VECTOR_INDEX('Insight', 'insight_embedding_idx', $vec, 30)
+                    WITH node AS i2, distance
+                    MATCH (i2)-[:INSIGHT_OPERATES_IN]->(d2:Domain)
+                    WHERE d2.name <> $domain AND i2.id <> $id
+                    AND NOT EXISTS {
+                        MATCH (i1:Insight {id: $id})-[:LED_TO|EVOLVED_FROM]-(i2)
+                    }
+                    RETURN i2.id, 1 - distance
+                    """,
+                    {"vec": embedding, "domain": domain, "id": insight_id},
+                )
+
+                for other_id, similarity in fetch_rows(neighbors):
+                    key = (insight_id, other_id) if insight_id < other_id else (other_id, insight_id)
+                    if similarity >= 0.8 and key not in seen:
+                        seen.add(key)
+                        pairs_to_connect.append({"id1": insight_id, "id2": other_id})
+
+            # One UNWIND batch creates all LED_TO edges. Note the old per-pair
+            # creates used bare timestamp(), which Kuzu rejects - those edge
+            # writes were silently failing inside their try/except.
+            if pairs_to_connect[:10]:
+                self.conn.execute(
+                    """
+                    UNWIND $pairs AS p
+                    MATCH (i1:Insight {id: p.id1})
+                    MATCH (i2:Insight {id: p.id2})
+                    CREATE (i1)-[:LED_TO {
+                        valid_from: timestamp($ts),
+                        contribution: 'contextual'
+                    }]->(i2)
+                    """,
+                    {"pairs": pairs_to_connect[:10], "ts": datetime.now().isoformat()},
+                )
+
+                # Degree bumps are pre-aggregated per node: an insight can
+                # appear in several pairs, and repeated SETs on one node in
+                # a single statement read the same snapshot instead of
+                # accumulating.
+                increments = Counter()
+                for pair in pairs_to_connect[:10]:
+                    increments[pair["id1"]] += 1
+                    increments[pair["id2"]] += 1
+                self.conn.execute(
+                    """
+                    UNWIND $incs AS inc
+                    MATCH (i:Insight {id: inc.id})
+                    SET i.degree = coalesce(i.degree, 0) + inc.n
+                    """,
+                    {"incs": [{"id": iid, "n": n} for iid, n in increments.items()]},
+                )
+                connections = len(pairs_to_connect[:10])
 
         except Exception as e:
             self.report.append(f"Error surfacing connections: {e}")
 
         return connections
-
-
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
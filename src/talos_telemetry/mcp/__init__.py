@@ -1,6 +1,10 @@
 """MCP tools module - Model Context Protocol tools for Talos."""
 
-from talos_telemetry.mcp.extract import journal_extract
+from talos_telemetry.mcp.extract import (
+    journal_extract,
+    journal_extract_async,
+    journal_extract_status,
+)
 from talos_telemetry.mcp.friction import friction_log
 from talos_telemetry.mcp.journal import journal_query, journal_write
 from talos_telemetry.mcp.patterns import pattern_check
@@ -16,6 +20,8 @@ __all__ = [
     "journal_write",
     "journal_query",
     "journal_extract",
+    "journal_extract_async",
+    "journal_extract_status",
     # Friction tracking
     "friction_log",
     # Meta-cognitive
@@ -0,0 +1,56 @@
+"""Background executor for non-critical MCP write side-effects.
+
+Session linkage edges and telemetry emission are independent of an MCP
+tool's return value but used to serialize on Kuzu inside the response
+path. Tools submit them here and return as soon as the primary entity is
+stored; worker threads get their own connection via the thread-local map
+in db.connection, so the deferred writes contend only on Kuzu's writer
+lock, not on the caller's thread.
+"""
+
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+_SIDE_EFFECT_POOL = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="talos-side-effect"
+)
+
+# Outstanding futures, so drain() can wait for everything in flight.
+_pending: set[Future] = set()
+_pending_lock = threading.Lock()
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """Queue a side-effect; the caller does not wait for it."""
+    future = _SIDE_EFFECT_POOL.submit(fn, *args)
+    with _pending_lock:
+        _pending.add(future)
+    future.add_done_callback(_discard)
+    return future
+
+
+def _discard(future: Future) -> None:
+    with _pending_lock:
+        _pending.discard(future)
+
+
+def drain() -> None:
+    """Block until every submitted side-effect has finished.
+
+    Call before closing the database or asserting on linkage edges in
+    tests; registered atexit so process shutdown never loses queued
+    writes. Side-effect exceptions are swallowed here the way the old
+    inline try/except blocks swallowed them.
+    """
+    while True:
+        with _pending_lock:
+            futures = list(_pending)
+        if not futures:
+            return
+        for future in futures:
+            future.exception()
+
+
+atexit.register(drain)
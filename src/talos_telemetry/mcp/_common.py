@@ -0,0 +1,24 @@
+"""Shared helpers for the MCP tool modules."""
+
+import itertools
+import secrets
+from datetime import datetime, timezone
+
+
+def now_iso() -> str:
+    """Return current UTC time as ISO format string for Kuzu timestamp()."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+# One random epoch per process plus a monotonic counter: ids stay unique
+# across processes via the epoch and within the process via the counter,
+# without paying urandom + strftime + uuid4 per id the old
+# timestamp-and-uuid format did. itertools.count consumes atomically under
+# the GIL, so concurrent tool threads never collide.
+_EPOCH = secrets.token_hex(4)
+_COUNTER = itertools.count()
+
+
+def new_id(prefix: str) -> str:
+    """Return a unique entity id: prefix, process epoch, monotonic counter."""
+    return f"{prefix}-{_EPOCH}-{next(_COUNTER):08x}"
@@ -1,22 +1,102 @@
 """Intelligent journal extraction MCP tool - LLM-powered entity extraction."""
 
-from datetime import datetime, timezone
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
-from uuid import uuid4
 
-from talos_telemetry.db.connection import get_connection
-from talos_telemetry.embeddings.model import get_embedding
+from talos_telemetry.db.connection import get_connection, kuzu_tx
+from talos_telemetry.db.kuzu_schema import REL_TABLES
+from talos_telemetry.embeddings.model import get_embeddings
+from talos_telemetry.mcp import _background
+from talos_telemetry.mcp._common import new_id, now_iso
+from talos_telemetry.mcp.patterns import invalidate_pattern_cache
 from talos_telemetry.telemetry.events import emit_knowledge_event
 
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO format string for Kuzu timestamp()."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+# One UNWIND statement per label: a batch of N extracted entities flushes in
+# one execute per distinct label instead of one per entity, and the stable
+# query text hits Kuzu's plan cache across calls. Every row carries the same
+# struct fields; each template picks the ones its label stores, so the
+# per-label property sets live here instead of in a string builder.
+_ENTITY_BATCH = {
+    "Insight": (
+        "UNWIND $rows AS r CREATE (e:Insight {id: r.id, content: r.content, "
+        "created_at: timestamp($ts), embedding: r.embedding, "
+        "confidence: r.confidence, domain: r.domain})"
+    ),
+    "Observation": (
+        "UNWIND $rows AS r CREATE (e:Observation {id: r.id, content: r.content, "
+        "observed_at: timestamp($ts), embedding: r.embedding, domain: r.domain})"
+    ),
+    "Friction": (
+        "UNWIND $rows AS r CREATE (e:Friction {id: r.id, description: r.content, "
+        "occurred_at: timestamp($ts), embedding: r.embedding, "
+        "category: 'extracted', recurrence_count: 1})"
+    ),
+    "Pattern": (
+        "UNWIND $rows AS r CREATE (e:Pattern {id: r.id, name: r.name, "
+        "description: r.content, first_noticed: timestamp($ts), "
+        "embedding: r.embedding, occurrence_count: 1, status: 'emerging'})"
+    ),
+    "Belief": (
+        "UNWIND $rows AS r CREATE (e:Belief {id: r.id, content: r.content, "
+        "adopted_at: timestamp($ts), embedding: r.embedding, "
+        "confidence: r.confidence, domain: r.domain, source: 'extracted'})"
+    ),
+    "Decision": (
+        "UNWIND $rows AS r CREATE (e:Decision {id: r.id, content: r.content, "
+        "made_at: timestamp($ts), embedding: r.embedding})"
+    ),
+    "Experience": (
+        "UNWIND $rows AS r CREATE (e:Experience {id: r.id, description: r.content, "
+        "occurred_at: timestamp($ts), embedding: r.embedding})"
+    ),
+    "Reflection": (
+        "UNWIND $rows AS r CREATE (e:Reflection {id: r.id, content: r.content, "
+        "occurred_at: timestamp($ts), embedding: r.embedding})"
+    ),
+}
+
+# Labels with a PRODUCED_* rel table from Session in the schema. The old
+# per-entity form templated PRODUCED_{TYPE} for every label and let the
+# missing-table error disappear in a bare except for Belief and Experience.
+_PRODUCED_LABELS = frozenset(
+    {"Insight", "Pattern", "Decision", "Observation", "Friction", "Reflection"}
+)
+
+# Rel tables that declare valid_from, read off the schema: REVEALED and
+# REFINES tables carry other properties, and stamping valid_from on them
+# raises - which inside an explicit transaction would roll back the call.
+_TIMESTAMPED_RELS = frozenset(
+    name
+    for name, _, _, props in REL_TABLES
+    if any(prop.startswith("valid_from") for prop in props)
+)
+
+
+@cache
+def _produced_query(entity_type: str) -> str:
+    """Build the batched PRODUCED_* statement for a label, cached per label."""
+    return (
+        f"UNWIND $ids AS eid "
+        f"MATCH (s:Session {{id: $sid}}) "
+        f"MATCH (e:{entity_type} {{id: eid}}) "
+        f"CREATE (s)-[:PRODUCED_{entity_type.upper()} {{valid_from: timestamp($ts)}}]->(e) "
+        f"SET e.degree = coalesce(e.degree, 0) + 1"
+    )
 
 
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
+@cache
+def _relationship_query(from_type: str, to_type: str, rel_table: str) -> str:
+    """Build the batched edge-create statement for one rel group, cached."""
+    props = " {valid_from: timestamp($ts)}" if rel_table in _TIMESTAMPED_RELS else ""
+    return (
+        f"UNWIND $rows AS r "
+        f"MATCH (a:{from_type} {{id: r.fid}}) "
+        f"MATCH (b:{to_type} {{id: r.tid}}) "
+        f"CREATE (a)-[:{rel_table}{props}]->(b)"
+    )
 
 
 def journal_extract(
@@ -31,6 +111,15 @@ def journal_extract(
     to automatically classify and extract structured entities from natural
     language input.
 
+    Entities are collected into per-label batches and relationships into
+    per-rel-table batches, so an extraction of N entities and M
+    relationships costs one execute per distinct label/table rather than
+    2N+M round-trips through the query engine. All writes commit as one
+    explicit transaction: one WAL flush for the whole extraction, and a
+    failure stores nothing rather than a partial graph. Session linkage
+    and telemetry emission are deferred to the side-effect pool, so the
+    call returns once the extracted graph itself is stored.
+
     Args:
         content: Free-form text to extract entities from.
         session_id: Associated session for PRODUCED relationships.
@@ -62,43 +151,47 @@ def journal_extract(
             }
 
         conn = get_connection()
-        stored_entities = []
-        entity_id_map = {}  # Map extraction index to stored entity ID
-
-        # Store each extracted entity
-        for i, entity in enumerate(extraction_result.entities):
-            entity_id = _store_entity(
-                conn=conn,
-                entity_type=entity.entity_type,
-                content=entity.content,
-                confidence=entity.confidence,
-                domain=entity.domain,
-                session_id=session_id,
+        now = now_iso()
+
+        # One encode for the whole extraction: the per-row cost of the
+        # transformer forward pass is small next to its fixed dispatch
+        # cost, so N entities embed in roughly the time one did.
+        storable = [
+            (i, entity)
+            for i, entity in enumerate(extraction_result.entities)
+            if entity.entity_type in _ENTITY_BATCH
+        ]
+        vectors = (
+            get_embeddings([entity.content for _, entity in storable])
+            if storable
+            else []
+        )
+
+        # Collect rows per label; each label flushes in one UNWIND below.
+        batches: dict[str, list[dict]] = defaultdict(list)
+        entity_meta = {}  # Map extraction index to (stored ID, entity)
+        for (i, entity), vector in zip(storable, vectors):
+            entity_id = new_id(entity.entity_type.lower())
+            batches[entity.entity_type].append(
+                {
+                    "id": entity_id,
+                    "content": entity.content,
+                    "name": entity.content[:50],
+                    "confidence": entity.confidence,
+                    "domain": entity.domain,
+                    "embedding": vector.tolist(),
+                }
             )
+            entity_meta[i] = (entity_id, entity)
 
-            if entity_id:
-                entity_id_map[i] = (entity_id, entity.entity_type)
-                stored_entities.append(
-                    {
-                        "id": entity_id,
-                        "type": entity.entity_type,
-                        "content": entity.content,
-                        "confidence": entity.confidence,
-                        "domain": entity.domain,
-                    }
-                )
-
-                # Emit telemetry
-                emit_knowledge_event(
-                    entity.entity_type.lower(),
-                    session_id or "unknown",
-                    entity_id,
-                    domain=entity.domain,
-                    confidence=entity.confidence,
-                )
+        entity_id_map = {
+            i: (entity_id, entity.entity_type)
+            for i, (entity_id, entity) in entity_meta.items()
+        }
 
-        # Store relationships between entities
-        stored_relationships = []
+        # Resolve relationships against the planned IDs, grouped per rel
+        # table so each group is one statement.
+        rel_groups: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
         for rel in extraction_result.relationships:
             from_idx = rel.get("from_index")
             to_idx = rel.get("to_index")
@@ -110,21 +203,67 @@ def journal_extract(
 
                 rel_table = _get_relationship_table(from_type, to_type, rel_type)
                 if rel_table:
-                    try:
-                        conn.execute(f"""
-                            MATCH (a:{from_type} {{id: '{from_id}'}})
-                            MATCH (b:{to_type} {{id: '{to_id}'}})
-                            CREATE (a)-[:{rel_table} {{valid_from: timestamp('{_now_iso()}')}}]->(b)
-                        """)
-                        stored_relationships.append(
-                            {
-                                "from_id": from_id,
-                                "to_id": to_id,
-                                "type": rel_table,
-                            }
-                        )
-                    except Exception:
-                        pass  # Relationship creation failed
+                    rel_groups[(from_type, to_type, rel_table)].append(
+                        {"fid": from_id, "tid": to_id}
+                    )
+
+        # Degree bumps are pre-aggregated per endpoint: one entity can appear
+        # in several relationships, and repeated SETs on one node within a
+        # single statement read the same snapshot instead of accumulating.
+        increments: Counter = Counter()
+        for (from_type, to_type, _), rows in rel_groups.items():
+            for row in rows:
+                increments[(from_type, row["fid"])] += 1
+                increments[(to_type, row["tid"])] += 1
+        incs_by_label: dict[str, list[dict]] = defaultdict(list)
+        for (label, entity_id), n in increments.items():
+            incs_by_label[label].append({"id": entity_id, "n": n})
+
+        with kuzu_tx(conn):
+            for entity_type, rows in batches.items():
+                conn.execute(_ENTITY_BATCH[entity_type], {"rows": rows, "ts": now})
+
+            for (from_type, to_type, rel_table), rows in rel_groups.items():
+                params: dict[str, Any] = {"rows": rows}
+                if rel_table in _TIMESTAMPED_RELS:
+                    params["ts"] = now
+                conn.execute(_relationship_query(from_type, to_type, rel_table), params)
+
+            for label, incs in incs_by_label.items():
+                conn.execute(
+                    f"UNWIND $incs AS inc MATCH (e:{label} {{id: inc.id}}) "
+                    f"SET e.degree = coalesce(e.degree, 0) + inc.n",
+                    {"incs": incs},
+                )
+
+        stored_entities = [
+            {
+                "id": entity_id,
+                "type": entity.entity_type,
+                "content": entity.content,
+                "confidence": entity.confidence,
+                "domain": entity.domain,
+            }
+            for entity_id, entity in entity_meta.values()
+        ]
+
+        invalidate_pattern_cache()
+
+        # Session linkage and telemetry are independent of the response;
+        # defer them so extraction returns once the entities are stored.
+        ids_by_label = {
+            entity_type: [row["id"] for row in rows]
+            for entity_type, rows in batches.items()
+        }
+        _background.submit(
+            _link_extraction, session_id, ids_by_label, stored_entities, now
+        )
+
+        stored_relationships = [
+            {"from_id": row["fid"], "to_id": row["tid"], "type": rel_table}
+            for (_, _, rel_table), rows in rel_groups.items()
+            for row in rows
+        ]
 
         return {
             "success": True,
@@ -140,167 +279,137 @@ def journal_extract(
         }
 
 
-def _store_entity(
-    conn,
-    entity_type: str,
+# Single-worker queue for asynchronous extraction: the LLM call is the
+# long pole (hundreds of ms to seconds), so throughput-oriented callers
+# enqueue and poll instead of holding the request open. One worker keeps
+# extractions ordered and avoids piling concurrent LLM calls.
+_EXTRACT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="talos-extract")
+
+# Job records, keyed by job id; values hold status plus the result dict
+# once the job finishes. Grows one small dict per job for the process
+# lifetime, which is bounded for session-scoped MCP servers.
+_JOBS: dict[str, dict[str, Any]] = {}
+
+
+def journal_extract_async(
     content: str,
-    confidence: float,
-    domain: str | None,
-    session_id: str | None,
-) -> str | None:
-    """Store a single entity in the graph.
+    session_id: str | None = None,
+    provider: str = "openai",
+    model: str | None = None,
+) -> dict[str, Any]:
+    """Queue an extraction and return immediately with a job id.
+
+    The asynchronous variant of journal_extract: the LLM call and storage
+    run on a background worker, so ingestion throughput is not coupled to
+    LLM latency. Poll journal_extract_status for the outcome.
+
+    Args:
+        content: Free-form text to extract entities from.
+        session_id: Associated session for PRODUCED relationships.
+        provider: LLM provider ("openai" or "anthropic").
+        model: Model to use (defaults per provider).
 
     Returns:
-        Entity ID if stored successfully, None otherwise.
+        Dict with the job id and queued status.
     """
-    entity_id = (
-        f"{entity_type.lower()}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
-    )
-    embedding = get_embedding(content)
+    job_id = new_id("extract-job")
+    _JOBS[job_id] = {"status": "queued"}
+    _EXTRACT_POOL.submit(_run_extract_job, job_id, content, session_id, provider, model)
+    return {"success": True, "job_id": job_id, "status": "queued"}
 
-    try:
-        if entity_type == "Insight":
-            props = _build_props(
-                id=entity_id,
-                content=content,
-                created_at="timestamp()",
-                embedding=embedding,
-                confidence=confidence,
-                domain=domain,
-            )
-            conn.execute(f"CREATE (e:Insight {{{props}}})")
-
-        elif entity_type == "Observation":
-            props = _build_props(
-                id=entity_id,
-                content=content,
-                observed_at="timestamp()",
-                embedding=embedding,
-                domain=domain,
-            )
-            conn.execute(f"CREATE (e:Observation {{{props}}})")
-
-        elif entity_type == "Friction":
-            props = _build_props(
-                id=entity_id,
-                description=content,
-                occurred_at="timestamp()",
-                embedding=embedding,
-                category="extracted",
-                recurrence_count=1,
-            )
-            conn.execute(f"CREATE (e:Friction {{{props}}})")
-
-        elif entity_type == "Pattern":
-            props = _build_props(
-                id=entity_id,
-                name=content[:50],
-                description=content,
-                first_noticed="timestamp()",
-                embedding=embedding,
-                occurrence_count=1,
-                status="emerging",
-            )
-            conn.execute(f"CREATE (e:Pattern {{{props}}})")
-
-        elif entity_type == "Belief":
-            props = _build_props(
-                id=entity_id,
-                content=content,
-                adopted_at="timestamp()",
-                embedding=embedding,
-                confidence=confidence,
-                domain=domain,
-                source="extracted",
-            )
-            conn.execute(f"CREATE (e:Belief {{{props}}})")
-
-        elif entity_type == "Decision":
-            props = _build_props(
-                id=entity_id,
-                content=content,
-                made_at="timestamp()",
-                embedding=embedding,
-            )
-            conn.execute(f"CREATE (e:Decision {{{props}}})")
-
-        elif entity_type == "Experience":
-            props = _build_props(
-                id=entity_id,
-                description=content,
-                occurred_at="timestamp()",
-                embedding=embedding,
-            )
-            conn.execute(f"CREATE (e:Experience {{{props}}})")
-
-        elif entity_type == "Reflection":
-            props = _build_props(
-                id=entity_id,
-                content=content,
-                occurred_at="timestamp()",
-                embedding=embedding,
-            )
-            conn.execute(f"CREATE (e:Reflection {{{props}}})")
-
-        else:
-            return None
-
-        # Create PRODUCED relationship if session provided
-        if session_id:
-            rel_type = f"PRODUCED_{entity_type.upper()}"
-            try:
-                conn.execute(f"""
-                    MATCH (s:Session {{id: '{session_id}'}})
-                    MATCH (e:{entity_type} {{id: '{entity_id}'}})
-                    CREATE (s)-[:{rel_type} {{valid_from: timestamp('{_now_iso()}')}}]->(e)
-                """)
-            except Exception:
-                pass
-
-        return entity_id
-
-    except Exception:
-        return None
-
-
-def _build_props(**kwargs) -> str:
-    """Build property string for Cypher CREATE."""
-    parts = []
-    for key, value in kwargs.items():
-        if value is None:
-            continue
-        if key == "embedding":
-            parts.append(f"{key}: {value}")
-        elif value == "timestamp()":
-            parts.append(f"{key}: timestamp('{_now_iso()}')")
-        elif isinstance(value, str):
-            parts.append(f"{key}: '{_escape(value)}'")
-        elif isinstance(value, (int, float)):
-            parts.append(f"{key}: {value}")
-        elif isinstance(value, bool):
-            parts.append(f"{key}: {'true' if value else 'false'}")
-    return ", ".join(parts)
 
+def journal_extract_status(job_id: str) -> dict[str, Any]:
+    """Report the state of a queued extraction.
 
-def _get_relationship_table(from_type: str, to_type: str, rel_type: str) -> str | None:
-    """Get the correct relationship table name for entity types.
+    Args:
+        job_id: Id returned by journal_extract_async.
 
-    Kuzu requires specific table names for each FROM-TO pair.
+    Returns:
+        Dict with job status (queued, running, done, failed) and, once
+        finished, the extraction result.
     """
-    # Map common extracted relationships to Kuzu tables
-    rel_map = {
-        ("Friction", "Insight", "LED_TO"): "FRICTION_LED_TO_INSIGHT",
-        ("Insight", "Insight", "LED_TO"): "LED_TO",
-        ("Insight", "Belief", "LED_TO"): "INSIGHT_LED_TO_BELIEF",
-        ("Insight", "Decision", "LED_TO"): "INSIGHT_LED_TO_DECISION",
-        ("Experience", "Insight", "LED_TO"): "EXPERIENCE_LED_TO_INSIGHT",
-        ("Belief", "Belief", "CONTRADICTS"): "CONTRADICTS",
-        ("Belief", "Belief", "REFINES"): "BELIEF_REFINES",
-        ("Insight", "Insight", "REFINES"): "INSIGHT_REFINES",
-        ("Friction", "Limitation", "REVEALED"): "FRICTION_REVEALED_LIMITATION",
-        ("Friction", "Capability", "REVEALED"): "FRICTION_REVEALED_CAPABILITY",
-        ("Experience", "Limitation", "REVEALED"): "EXPERIENCE_REVEALED_LIMITATION",
-        ("Experience", "Capability", "REVEALED"): "EXPERIENCE_REVEALED_CAPABILITY",
-    }
-
-    return rel_map.get((from_type, to_type, rel_type))
+    job = _JOBS.get(job_id)
+    if job is None:
+        return {"success": False, "error": f"Unknown job: {job_id}"}
+    return {"success": True, "job_id": job_id, **job}
+
+
+def _run_extract_job(
+    job_id: str,
+    content: str,
+    session_id: str | None,
+    provider: str,
+    model: str | None,
+) -> None:
+    """Worker body: run the synchronous extraction and record the outcome."""
+    _JOBS[job_id] = {"status": "running"}
+    result = journal_extract(content, session_id=session_id, provider=provider, model=model)
+    status = "done" if result.get("success") else "failed"
+    _JOBS[job_id] = {"status": status, "result": result}
+
+
+def _link_extraction(
+    session_id: str | None,
+    ids_by_label: dict[str, list[str]],
+    stored_entities: list[dict],
+    now: str,
+) -> None:
+    """Link stored entities to the session and emit telemetry.
+
+    Runs on the side-effect pool, on the worker thread's own connection,
+    one PRODUCED_* batch per label plus a single session degree bump.
+    """
+    if session_id:
+        conn = get_connection()
+        try:
+            with kuzu_tx(conn):
+                produced = 0
+                for entity_type, ids in ids_by_label.items():
+                    if entity_type not in _PRODUCED_LABELS:
+                        continue
+                    conn.execute(
+                        _produced_query(entity_type),
+                        {"ids": ids, "sid": session_id, "ts": now},
+                    )
+                    produced += len(ids)
+                if produced:
+                    conn.execute(
+                        "MATCH (s:Session {id: $sid}) "
+                        "SET s.degree = coalesce(s.degree, 0) + $n",
+                        {"sid": session_id, "n": produced},
+                    )
+        except Exception:
+            pass  # A missing session loses only linkage edges
+
+    for stored in stored_entities:
+        emit_knowledge_event(
+            stored["type"].lower(),
+            session_id or "unknown",
+            stored["id"],
+            domain=stored["domain"],
+            confidence=stored["confidence"],
+        )
+
+
+# Map common extracted relationships to Kuzu tables; Kuzu requires a
+# specific table name per FROM-TO pair. Module-level so the relationship
+# loop does one dict probe per edge instead of rebuilding the literal.
+_REL_TABLE = {
+    ("Friction", "Insight", "LED_TO"): "FRICTION_LED_TO_INSIGHT",
+    ("Insight", "Insight", "LED_TO"): "LED_TO",
+    ("Insight", "Belief", "LED_TO"): "INSIGHT_LED_TO_BELIEF",
+    ("Insight", "Decision", "LED_TO"): "INSIGHT_LED_TO_DECISION",
+    ("Experience", "Insight", "LED_TO"): "EXPERIENCE_LED_TO_INSIGHT",
+    ("Belief", "Belief", "CONTRADICTS"): "CONTRADICTS",
+    ("Belief", "Belief", "REFINES"): "BELIEF_REFINES",
+    ("Insight", "Insight", "REFINES"): "INSIGHT_REFINES",
+    ("Friction", "Limitation", "REVEALED"): "FRICTION_REVEALED_LIMITATION",
+    ("Friction", "Capability", "REVEALED"): "FRICTION_REVEALED_CAPABILITY",
+    ("Experience", "Limitation", "REVEALED"): "EXPERIENCE_REVEALED_LIMITATION",
+    ("Experience", "Capability", "REVEALED"): "EXPERIENCE_REVEALED_CAPABILITY",
+}
+
+
+def _get_relationship_table(from_type: str, to_type: str, rel_type: str) -> str | None:
+    """Get the correct relationship table name for entity types."""
+    return _REL_TABLE.get((from_type, to_type, rel_type))
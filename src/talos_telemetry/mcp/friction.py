@@ -1,17 +1,83 @@
 """Friction logging MCP tool."""
 
-from datetime import datetime, timezone
 from typing import Any
-from uuid import uuid4
 
-from talos_telemetry.db.connection import get_connection
-from talos_telemetry.embeddings.model import get_embedding
+from talos_telemetry.db.connection import fetch_rows, get_connection, kuzu_tx
+from talos_telemetry.db.kuzu_schema import ensure_fts_index
+from talos_telemetry.embeddings.model import get_embedding_list
+from talos_telemetry.mcp._common import new_id, now_iso
+from talos_telemetry.mcp.patterns import invalidate_pattern_cache
 from talos_telemetry.telemetry.events import emit_knowledge_event
 
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO format string for Kuzu timestamp()."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+# Module-level query text: values bind as parameters, so the stable text
+# hits Kuzu's plan cache and descriptions never pass through escaping.
+_CREATE_FRICTION = (
+    "CREATE (f:Friction {id: $id, description: $description, "
+    "category: $category, occurred_at: timestamp($ts), "
+    "recurrence_count: 1, embedding: $embedding})"
+)
+
+# Self-relative increment: the match from the similarity probe is not
+# re-read to compute the new count engine-side.
+_INCREMENT_FRICTION = (
+    "MATCH (f:Friction {id: $fid}) SET f.recurrence_count = f.recurrence_count + 1"
+)
+
+# MERGE on the bare edge, stamping valid_from (and the degree counters)
+# only on create: the old form put timestamp('<now>') inside the MERGE
+# pattern itself, so no call ever matched an existing edge and every log
+# duplicated the link.
+_LINK_SESSION = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (f:Friction {id: $fid}) "
+    "MERGE (s)-[r:PRODUCED_FRICTION]->(f) "
+    "ON CREATE SET r.valid_from = timestamp($ts), "
+    "s.degree = coalesce(s.degree, 0) + 1, f.degree = coalesce(f.degree, 0) + 1"
+)
+
+# Blocking variant fuses the PRODUCED_FRICTION MERGE and the
+# SESSION_BLOCKED_BY CREATE behind one pair of node matches, halving the
+# round-trips when a blocking friction is logged. Verified the degree
+# counters accumulate across both SET clauses within the statement.
+_LINK_SESSION_BLOCKING = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (f:Friction {id: $fid}) "
+    "MERGE (s)-[r:PRODUCED_FRICTION]->(f) "
+    "ON CREATE SET r.valid_from = timestamp($ts), "
+    "s.degree = coalesce(s.degree, 0) + 1, f.degree = coalesce(f.degree, 0) + 1 "
+    "WITH s, f "
+    "CREATE (s)-[:SESSION_BLOCKED_BY {severity: 'blocking'}]->(f) "
+    "SET s.degree = coalesce(s.degree, 0) + 1, f.degree = coalesce(f.degree, 0) + 1"
+)
+
+# Conjunctive FTS probe: every term of the new description must appear,
+# which is the duplicate-detection semantic the substring scan approximated.
+# The index probe is O(terms) where the CONTAINS scan was O(#frictions)
+# with a per-row toLower.
+_FIND_SIMILAR_FTS = (
+    "CALL QUERY_FTS_INDEX('Friction', 'friction_fts_idx', $q, conjunctive := true) "
+    "YIELD node, score "
+    "RETURN node.id, node.description, node.recurrence_count "
+    "ORDER BY score DESC "
+    "LIMIT 5"
+)
+
+# Migration fallback while a database lacks the FTS index.
+_FIND_SIMILAR_SCAN = (
+    "MATCH (f:Friction) "
+    "WHERE toLower(f.description) CONTAINS $term "
+    "RETURN f.id, f.description, f.recurrence_count "
+    "LIMIT 5"
+)
+
+_fts_ready = False
+
+# Accepted categories: a frozenset for the O(1) membership check, built
+# once instead of a fresh list per call; the tuple keeps a stable order
+# for error messages.
+_VALID_CATEGORIES = ("tooling", "conceptual", "process", "environmental", "relational")
+_VALID_CATEGORY_SET = frozenset(_VALID_CATEGORIES)
 
 
 def friction_log(
@@ -33,72 +99,61 @@ def friction_log(
     Returns:
         Dict with friction ID and recurrence info.
     """
-    valid_categories = ["tooling", "conceptual", "process", "environmental", "relational"]
-    if category not in valid_categories:
+    if category not in _VALID_CATEGORY_SET:
         return {
             "success": False,
-            "error": f"Invalid category: {category}. Valid: {valid_categories}",
+            "error": f"Invalid category: {category}. Valid: {list(_VALID_CATEGORIES)}",
         }
 
     try:
         conn = get_connection()
+        # One timestamp per request: the friction and its linkage edges
+        # carry the same instant.
+        now = now_iso()
 
         # Check for similar existing friction
         similar_frictions = _find_similar_friction(conn, description)
 
         if similar_frictions:
-            # Increment existing friction
             existing = similar_frictions[0]
             friction_id = existing["id"]
             new_count = existing["recurrence_count"] + 1
-
-            conn.execute(f"""
-                MATCH (f:Friction {{id: '{friction_id}'}})
-                SET f.recurrence_count = {new_count}
-            """)
-
             is_recurring = True
-
+            embedding = None
         else:
-            # Create new friction
-            friction_id = f"friction-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
-            embedding = get_embedding(description)
-
-            conn.execute(f"""
-                CREATE (f:Friction {{
-                    id: '{friction_id}',
-                    description: '{_escape(description)}',
-                    category: '{category}',
-                    occurred_at: timestamp('{_now_iso()}'),
-                    recurrence_count: 1,
-                    embedding: {embedding}
-                }})
-            """)
-
+            friction_id = new_id("friction")
+            embedding = get_embedding_list(description)
             is_recurring = False
             new_count = 1
 
-        # Create PRODUCED_FRICTION relationship if session provided
-        if session_id:
-            try:
-                conn.execute(f"""
-                    MATCH (s:Session {{id: '{session_id}'}})
-                    MATCH (f:Friction {{id: '{friction_id}'}})
-                    MERGE (s)-[:PRODUCED_FRICTION {{valid_from: timestamp('{_now_iso()}')}}]->(f)
-                """)
-            except Exception:
-                pass
-
-        # If blocking, create SESSION_BLOCKED_BY relationship
-        if blocking and session_id:
-            try:
-                conn.execute(f"""
-                    MATCH (s:Session {{id: '{session_id}'}})
-                    MATCH (f:Friction {{id: '{friction_id}'}})
-                    CREATE (s)-[:SESSION_BLOCKED_BY {{severity: 'blocking'}}]->(f)
-                """)
-            except Exception:
-                pass
+        # All writes for the log entry commit as one explicit transaction -
+        # a single WAL flush instead of one per statement. A missing
+        # session is a MATCH with no hits, not an error, so the optional
+        # edges cannot poison the transaction.
+        with kuzu_tx(conn):
+            if is_recurring:
+                # Increment existing friction
+                conn.execute(_INCREMENT_FRICTION, {"fid": friction_id})
+            else:
+                # Create new friction
+                conn.execute(
+                    _CREATE_FRICTION,
+                    {
+                        "id": friction_id,
+                        "description": description,
+                        "category": category,
+                        "ts": now,
+                        "embedding": embedding,
+                    },
+                )
+
+            # Link to the session: the blocking variant adds the
+            # SESSION_BLOCKED_BY edge in the same statement.
+            if session_id:
+                statement = _LINK_SESSION_BLOCKING if blocking else _LINK_SESSION
+                conn.execute(statement, {"sid": session_id, "fid": friction_id, "ts": now})
+
+        invalidate_pattern_cache()
 
         # Emit telemetry event
         emit_knowledge_event(
@@ -129,38 +184,25 @@ def friction_log(
 
 
 def _find_similar_friction(conn, description: str) -> list[dict]:
-    """Find similar existing friction points."""
-    similar = []
+    """Find similar existing friction points via the full-text index."""
+    global _fts_ready
+    if not _fts_ready:
+        ensure_fts_index(conn, "Friction", "friction_fts_idx", ("description",))
+        _fts_ready = True
 
-    # Simple substring matching for now
-    # TODO: Use embedding similarity when vector index is available
     try:
-        # Take first 50 chars for matching
-        search_term = description[:50].lower()
-
-        result = conn.execute(f"""
-            MATCH (f:Friction)
-            WHERE toLower(f.description) CONTAINS '{_escape(search_term)}'
-            RETURN f.id, f.description, f.recurrence_count
-            LIMIT 5
-        """)
-
-        while result.has_next():
-            row = result.get_next()
-            similar.append(
-                {
-                    "id": row[0],
-                    "description": row[1],
-                    "recurrence_count": row[2] or 1,
-                }
-            )
-
+        rows = fetch_rows(conn.execute(_FIND_SIMILAR_FTS, {"q": description}))
     except Exception:
-        pass
-
-    return similar
-
+        # Index missing (pre-migration database): fall back to the
+        # substring scan on the first 50 chars.
+        try:
+            rows = fetch_rows(
+                conn.execute(_FIND_SIMILAR_SCAN, {"term": description[:50].lower()})
+            )
+        except Exception:
+            return []
 
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
+    return [
+        {"id": row[0], "description": row[1], "recurrence_count": row[2] or 1}
+        for row in rows
+    ]
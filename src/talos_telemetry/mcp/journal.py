@@ -1,17 +1,128 @@
 """Journal MCP tools - write and query journal entries."""
 
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
-from uuid import uuid4
 
-from talos_telemetry.db.connection import get_connection
-from talos_telemetry.embeddings.model import get_embedding
+import numpy as np
+
+from talos_telemetry.db.connection import fetch_rows, get_connection
+from talos_telemetry.embeddings.model import get_embedding_list, topk_cosine
+from talos_telemetry.mcp import _background
+from talos_telemetry.mcp._common import new_id, now_iso
+from talos_telemetry.mcp.friction import friction_log
+from talos_telemetry.mcp.patterns import invalidate_pattern_cache
 from talos_telemetry.telemetry.events import emit_knowledge_event
 
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO format string for Kuzu timestamp()."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+# One pre-baked CREATE per journal label, keyed by category: the statement
+# text is constant at import time and each entry binds the same parameter
+# set, with absent optionals (domain, confidence) binding as NULL - the
+# same stored value omitting the property produced. Replaces a per-call
+# if/elif chain that assembled a props dict per label.
+_ENTITY_SPEC: dict[str, tuple[str, str]] = {
+    "insight": (
+        "Insight",
+        "CREATE (e:Insight {id: $id, content: $content, created_at: timestamp($ts), "
+        "embedding: $embedding, domain: $domain, confidence: $confidence})",
+    ),
+    "observation": (
+        "Observation",
+        "CREATE (e:Observation {id: $id, content: $content, "
+        "observed_at: timestamp($ts), embedding: $embedding, domain: $domain})",
+    ),
+    "reflection": (
+        "Reflection",
+        "CREATE (e:Reflection {id: $id, content: $content, "
+        "occurred_at: timestamp($ts), embedding: $embedding})",
+    ),
+    "experience": (
+        "Experience",
+        "CREATE (e:Experience {id: $id, description: $content, "
+        "occurred_at: timestamp($ts), embedding: $embedding})",
+    ),
+    "decision": (
+        "Decision",
+        "CREATE (e:Decision {id: $id, content: $content, made_at: timestamp($ts), "
+        "embedding: $embedding})",
+    ),
+}
+
+# Parameter names each statement binds; Kuzu rejects unused parameters, so
+# the param dict is filtered per label rather than passed wholesale.
+_SPEC_PARAMS: dict[str, tuple[str, ...]] = {
+    category: tuple(
+        name
+        for name in ("id", "content", "ts", "embedding", "domain", "confidence")
+        if f"${name}" in statement
+    )
+    for category, (_, statement) in _ENTITY_SPEC.items()
+}
+
+# Linking an entry to its domain; of the journal labels only Insight has an
+# OPERATES_IN rel table in the schema. Values bind as parameters so the
+# stable text hits Kuzu's plan cache and content never touches query text.
+_LINK_INSIGHT_DOMAIN = (
+    "MATCH (e:Insight {id: $eid}) "
+    "MATCH (d:Domain {name: $domain}) "
+    "CREATE (e)-[:INSIGHT_OPERATES_IN]->(d) "
+    "SET e.degree = coalesce(e.degree, 0) + 1, d.degree = coalesce(d.degree, 0) + 1"
+)
+
+
+@cache
+def _produced_query(entity_type: str) -> str:
+    """Build the PRODUCED_* statement for a label, cached per label."""
+    return (
+        f"MATCH (s:Session {{id: $sid}}) "
+        f"MATCH (e:{entity_type} {{id: $eid}}) "
+        f"CREATE (s)-[:PRODUCED_{entity_type.upper()} {{valid_from: timestamp($ts)}}]->(e) "
+        f"SET s.degree = coalesce(s.degree, 0) + 1, e.degree = coalesce(e.degree, 0) + 1"
+    )
+
+
+def _link_entry(
+    entity_type: str,
+    entity_id: str,
+    category: str,
+    session_id: str | None,
+    domain: str | None,
+    confidence: float | None,
+    now: str,
+) -> None:
+    """Attach linkage edges and emit telemetry for a stored entry.
+
+    Runs on the side-effect pool, on the worker thread's own connection.
+    A missing session or domain is a MATCH with no hits, not an error.
+    """
+    conn = get_connection()
+
+    # PRODUCED_* tables are typed (PRODUCED_INSIGHT, etc.); Experience has
+    # no such table in the schema.
+    if session_id and entity_type != "Experience":
+        try:
+            conn.execute(
+                _produced_query(entity_type),
+                {"sid": session_id, "eid": entity_id, "ts": now},
+            )
+        except Exception:
+            pass
+
+    # OPERATES_IN tables are typed per label too; of the journal categories
+    # only Insight has a Domain rel table.
+    if domain and entity_type == "Insight":
+        try:
+            conn.execute(_LINK_INSIGHT_DOMAIN, {"eid": entity_id, "domain": domain})
+        except Exception:
+            pass
+
+    emit_knowledge_event(
+        category,
+        session_id or "unknown",
+        entity_id,
+        domain=domain,
+        confidence=confidence,
+    )
 
 
 def journal_write(
@@ -35,122 +146,55 @@ def journal_write(
     Returns:
         Dict with entity ID and extraction results.
     """
+    if category == "friction":
+        # For friction, use friction_log instead
+        return friction_log(content, "conceptual", session_id)
+
+    spec = _ENTITY_SPEC.get(category)
+    if not spec:
+        valid = ["friction", *list(_ENTITY_SPEC)]
+        return {
+            "success": False,
+            "error": f"Unknown category: {category}. Valid: {valid}",
+        }
+    entity_type, statement = spec
+
     try:
         conn = get_connection()
 
         # Generate ID and embedding
-        entity_id = f"{category}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
-        embedding = get_embedding(content)
-
-        # Map category to entity type
-        entity_map = {
-            "insight": "Insight",
-            "observation": "Observation",
-            "friction": "Friction",
-            "reflection": "Reflection",
-            "experience": "Experience",
-            "decision": "Decision",
+        entity_id = new_id(category)
+        embedding = get_embedding_list(content)
+
+        # One timestamp per request: every write in this logical entry -
+        # the entity and its deferred linkage edges - carries the same
+        # instant.
+        now = now_iso()
+
+        values = {
+            "id": entity_id,
+            "content": content,
+            "ts": now,
+            "embedding": embedding,
+            "domain": domain,
+            "confidence": confidence,
         }
+        params = {name: values[name] for name in _SPEC_PARAMS[category]}
 
-        entity_type = entity_map.get(category)
-        if not entity_type:
-            return {
-                "success": False,
-                "error": f"Unknown category: {category}. Valid: {list(entity_map.keys())}",
-            }
-
-        # Build CREATE statement based on entity type
-        if entity_type == "Insight":
-            props = {
-                "id": entity_id,
-                "content": content,
-                "created_at": "timestamp()",
-                "embedding": embedding,
-            }
-            if domain:
-                props["domain"] = domain
-            if confidence is not None:
-                props["confidence"] = confidence
-
-            _create_entity(conn, entity_type, props)
-
-        elif entity_type == "Observation":
-            props = {
-                "id": entity_id,
-                "content": content,
-                "observed_at": "timestamp()",
-                "embedding": embedding,
-            }
-            if domain:
-                props["domain"] = domain
-
-            _create_entity(conn, entity_type, props)
-
-        elif entity_type == "Friction":
-            # For friction, use friction_log instead
-            from talos_telemetry.mcp.friction import friction_log
-
-            result = friction_log(content, "conceptual", session_id)
-            return result
-
-        elif entity_type == "Reflection":
-            props = {
-                "id": entity_id,
-                "content": content,
-                "occurred_at": "timestamp()",
-                "embedding": embedding,
-            }
-            _create_entity(conn, entity_type, props)
-
-        elif entity_type == "Experience":
-            props = {
-                "id": entity_id,
-                "description": content,
-                "occurred_at": "timestamp()",
-                "embedding": embedding,
-            }
-            _create_entity(conn, entity_type, props)
-
-        elif entity_type == "Decision":
-            props = {
-                "id": entity_id,
-                "content": content,
-                "made_at": "timestamp()",
-                "embedding": embedding,
-            }
-            _create_entity(conn, entity_type, props)
-
-        # Create PRODUCED_* relationship if session provided
-        # Relationship table names are typed: PRODUCED_INSIGHT, PRODUCED_OBSERVATION, etc.
-        if session_id:
-            rel_type = f"PRODUCED_{entity_type.upper()}"
-            try:
-                conn.execute(f"""
-                    MATCH (s:Session {{id: '{session_id}'}})
-                    MATCH (e:{entity_type} {{id: '{entity_id}'}})
-                    CREATE (s)-[:{rel_type} {{valid_from: timestamp('{_now_iso()}')}}]->(e)
-                """)
-            except Exception:
-                pass  # Session might not exist
-
-        # Create OPERATES_IN relationship if domain provided
-        if domain:
-            try:
-                conn.execute(f"""
-                    MATCH (e:{entity_type} {{id: '{entity_id}'}})
-                    MATCH (d:Domain {{name: '{domain}'}})
-                    CREATE (e)-[:OPERATES_IN]->(d)
-                """)
-            except Exception:
-                pass  # Domain might not exist
-
-        # Emit telemetry event
-        emit_knowledge_event(
-            category,
-            session_id or "unknown",
+        conn.execute(statement, params)
+        invalidate_pattern_cache()
+
+        # Linkage edges and telemetry are independent of the response;
+        # defer them so the tool returns as soon as the entity is stored.
+        _background.submit(
+            _link_entry,
+            entity_type,
             entity_id,
-            domain=domain,
-            confidence=confidence,
+            category,
+            session_id,
+            domain,
+            confidence,
+            now,
         )
 
         return {
@@ -168,6 +212,111 @@ def journal_write(
         }
 
 
+# Content fields per searchable label; everything else stores `content`.
+_CONTENT_FIELDS = {"Experience": "description", "Pattern": "description", "Friction": "description"}
+
+
+@cache
+def _vector_query(entity_type: str) -> str:
+    """Build the HNSW probe for a label, cached per label.
+
+    The index call yields distance, not score - the old form asked for a
+    score column, which is a binder error, so every vector search fell
+    through to the FTS fallback. Similarity converts back to
+    higher-is-better so results merge with FTS scores.
+    """
+    field = _CONTENT_FIELDS.get(entity_type, "content")
+    return (
+        f"CALL QUERY_VECTOR_INDEX('{entity_type}', "
+        f"'{entity_type.lower()}_embedding_idx', $vec, $k) "
+        f"YIELD node, distance "
+        f"RETURN node.id as id, node.{field} as content, 1 - distance as score"
+    )
+
+
+@cache
+def _fts_query(entity_type: str) -> str:
+    """Build the FTS probe for a label, cached per label."""
+    field = _CONTENT_FIELDS.get(entity_type, "content")
+    return (
+        f"CALL QUERY_FTS_INDEX('{entity_type}', "
+        f"'{entity_type.lower()}_fts_idx', $q) "
+        f"YIELD node, score "
+        f"RETURN node.id as id, node.{field} as content, score "
+        f"LIMIT $k"
+    )
+
+
+# Fan-out pool for per-label index probes; four workers covers the default
+# label set.
+_QUERY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="talos-query")
+
+
+@cache
+def _scan_query(entity_type: str) -> str:
+    """Build the embedding scan for a label, cached per label."""
+    field = _CONTENT_FIELDS.get(entity_type, "content")
+    return (
+        f"MATCH (e:{entity_type}) WHERE e.embedding IS NOT NULL "
+        f"RETURN e.id, e.{field}, e.embedding"
+    )
+
+
+def _search_label(
+    entity_type: str, query: str, query_embedding: list[float], limit: int
+) -> list[dict]:
+    """Probe one label's vector index (FTS fallback) for matching entries.
+
+    When a database has neither index (fresh deployments), score the
+    label's embeddings client-side with the topk_cosine kernel rather
+    than returning nothing.
+    """
+    conn = get_connection()
+    try:
+        rows = fetch_rows(
+            conn.execute(_vector_query(entity_type), {"vec": query_embedding, "k": limit})
+        )
+    except Exception:
+        # Vector index might not exist, fall back to FTS
+        try:
+            rows = fetch_rows(
+                conn.execute(_fts_query(entity_type), {"q": query, "k": limit})
+            )
+        except Exception:
+            return _search_label_brute(conn, entity_type, query_embedding, limit)
+
+    return [
+        {"entity_type": entity_type, "id": row[0], "content": row[1], "score": row[2]}
+        for row in rows
+    ]
+
+
+def _search_label_brute(
+    conn, entity_type: str, query_embedding: list[float], limit: int
+) -> list[dict]:
+    """Score a label's embeddings client-side when no index exists."""
+    try:
+        rows = fetch_rows(conn.execute(_scan_query(entity_type)))
+    except Exception:
+        return []
+    if not rows:
+        return []
+
+    matrix = np.asarray([row[2] for row in rows], dtype=np.float32)
+    top, scores = topk_cosine(
+        query_embedding, matrix, limit, assume_normalized=True
+    )
+    return [
+        {
+            "entity_type": entity_type,
+            "id": rows[i][0],
+            "content": rows[i][1],
+            "score": float(score),
+        }
+        for i, score in zip(top, scores)
+    ]
+
+
 def journal_query(
     query: str,
     entity_types: list[str] | None = None,
@@ -186,70 +335,22 @@ def journal_query(
         Dict with search results.
     """
     try:
-        conn = get_connection()
-
         # Generate query embedding
-        query_embedding = get_embedding(query)
+        query_embedding = get_embedding_list(query)
 
         # Entity types to search
         search_types = entity_types or ["Insight", "Observation", "Pattern", "Belief"]
 
+        # One index probe per label, issued in parallel so the call costs
+        # max(probe latencies) instead of their sum. Each worker thread
+        # holds its own connection via the thread-local map; Connections
+        # are not shared across threads.
         results = []
-
-        for entity_type in search_types:
-            try:
-                # Get content field name
-                content_field = "content"
-                if entity_type == "Experience":
-                    content_field = "description"
-                elif entity_type == "Pattern":
-                    content_field = "description"
-
-                # Vector search
-                vector_results = conn.execute(f"""
-                    CALL QUERY_VECTOR_INDEX('{entity_type}',
-                        '{entity_type.lower()}_embedding_idx',
-                        {query_embedding},
-                        {limit})
-                    YIELD node, score
-                    RETURN node.id as id, node.{content_field} as content, score
-                """)
-
-                while vector_results.has_next():
-                    row = vector_results.get_next()
-                    results.append(
-                        {
-                            "entity_type": entity_type,
-                            "id": row[0],
-                            "content": row[1],
-                            "score": row[2],
-                        }
-                    )
-
-            except Exception:
-                # Vector index might not exist, fall back to FTS
-                try:
-                    fts_results = conn.execute(f"""
-                        CALL QUERY_FTS_INDEX('{entity_type}',
-                            '{entity_type.lower()}_fts_idx',
-                            '{_escape(query)}')
-                        YIELD node, score
-                        RETURN node.id as id, node.{content_field} as content, score
-                        LIMIT {limit}
-                    """)
-
-                    while fts_results.has_next():
-                        row = fts_results.get_next()
-                        results.append(
-                            {
-                                "entity_type": entity_type,
-                                "id": row[0],
-                                "content": row[1],
-                                "score": row[2],
-                            }
-                        )
-                except Exception:
-                    pass  # Index not available
+        for rows in _QUERY_POOL.map(
+            lambda entity_type: _search_label(entity_type, query, query_embedding, limit),
+            search_types,
+        ):
+            results.extend(rows)
 
         # Sort by score and limit
         results.sort(key=lambda x: x.get("score", 0), reverse=True)
@@ -267,28 +368,3 @@ def journal_query(
             "error": str(e),
         }
 
-
-def _create_entity(conn, entity_type: str, props: dict) -> None:
-    """Create entity with given properties."""
-    # Build property string
-    prop_parts = []
-    for key, value in props.items():
-        if key == "embedding":
-            prop_parts.append(f"{key}: {value}")
-        elif value == "timestamp()":
-            # Kuzu requires timestamp string argument
-            prop_parts.append(f"{key}: timestamp('{_now_iso()}')")
-        elif isinstance(value, str):
-            prop_parts.append(f"{key}: '{_escape(value)}'")
-        elif isinstance(value, (int, float)):
-            prop_parts.append(f"{key}: {value}")
-        elif isinstance(value, bool):
-            prop_parts.append(f"{key}: {'true' if value else 'false'}")
-
-    prop_string = ", ".join(prop_parts)
-    conn.execute(f"CREATE (e:{entity_type} {{{prop_string}}})")
-
-
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
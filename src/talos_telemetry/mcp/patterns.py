@@ -5,16 +5,119 @@ and generates Evolution proposals when thresholds are met.
 """
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Final
 
-from talos_telemetry.db.connection import get_connection
+from talos_telemetry.db.connection import fetch_rows, get_connection
 
 # Thresholds for pattern detection
-FRICTION_RECURRENCE_THRESHOLD = 3  # Friction recurring 3+ times warrants attention
-PATTERN_EMERGENCE_THRESHOLD = 2  # Pattern seen 2+ times is "emerging"
-PATTERN_CONFIRMATION_THRESHOLD = 5  # Pattern seen 5+ times is "confirmed"
-SEMANTIC_SIMILARITY_THRESHOLD = 0.85  # For detecting similar friction descriptions
+FRICTION_RECURRENCE_THRESHOLD: Final = 3  # Friction recurring 3+ times warrants attention
+PATTERN_EMERGENCE_THRESHOLD: Final = 2  # Pattern seen 2+ times is "emerging"
+PATTERN_CONFIRMATION_THRESHOLD: Final = 5  # Pattern seen 5+ times is "confirmed"
+SEMANTIC_SIMILARITY_THRESHOLD: Final = 0.85  # For detecting similar friction descriptions
+
+# The six finder queries, built once at import. Thresholds are baked into
+# the text rather than bound as parameters because Kuzu refuses to prepare
+# multi-statement strings; the text is still identical on every call.
+_RECURRING_FRICTION_Q: Final = f"""
+    MATCH (f:Friction)
+    WHERE f.recurrence_count >= {FRICTION_RECURRENCE_THRESHOLD}
+    RETURN f.id, f.description, f.category, f.recurrence_count, f.resolution,
+           CASE WHEN f.recurrence_count >= 5 THEN 'high' ELSE 'medium' END AS severity
+    ORDER BY f.recurrence_count DESC
+    LIMIT 20
+"""
+
+_EMERGING_PATTERNS_Q: Final = f"""
+    MATCH (p:Pattern)
+    WHERE p.occurrence_count >= {PATTERN_EMERGENCE_THRESHOLD}
+      AND p.occurrence_count < {PATTERN_CONFIRMATION_THRESHOLD}
+      AND (p.status IS NULL OR p.status = 'emerging')
+    RETURN p.id, p.name, p.description, p.occurrence_count, p.first_noticed
+    ORDER BY p.occurrence_count DESC
+    LIMIT 20
+"""
+
+_CONFIRMED_PATTERNS_Q: Final = f"""
+    MATCH (p:Pattern)
+    WHERE p.occurrence_count >= {PATTERN_CONFIRMATION_THRESHOLD}
+    RETURN p.id, p.name, p.description, p.occurrence_count,
+           coalesce(p.status, 'confirmed') AS status
+    ORDER BY p.occurrence_count DESC
+    LIMIT 20
+"""
+
+_BELIEF_CONTRADICTIONS_Q: Final = """
+    MATCH (b1:Belief)-[r:CONTRADICTS]->(b2:Belief)
+    RETURN b1.id, b1.content, b2.id, b2.content, r.resolution,
+           r.resolution IS NOT NULL AS resolved
+    LIMIT 20
+"""
+
+_UNRESOLVED_QUESTIONS_Q: Final = """
+    MATCH (q:Question)
+    WHERE q.resolved_at IS NULL
+    RETURN q.id, q.content, q.raised_at, q.domain,
+           coalesce(q.urgency, 'normal') AS urgency
+    ORDER BY q.raised_at DESC
+    LIMIT 20
+"""
+
+_FRICTION_INSIGHT_CHAINS_Q: Final = """
+    MATCH (f:Friction)-[r:FRICTION_LED_TO_INSIGHT]->(i:Insight)
+    RETURN f.id, f.description, i.id, i.content, r.valid_from
+    ORDER BY r.valid_from DESC
+    LIMIT 20
+"""
+
+# Count-only probes mirroring the finders: one cheap aggregate per bucket,
+# with no ordering or row materialization, decides which full queries are
+# worth running at all.
+_RECURRING_FRICTION_PROBE: Final = (
+    f"MATCH (f:Friction) WHERE f.recurrence_count >= {FRICTION_RECURRENCE_THRESHOLD} "
+    "RETURN count(f)"
+)
+
+_EMERGING_PATTERNS_PROBE: Final = (
+    f"MATCH (p:Pattern) WHERE p.occurrence_count >= {PATTERN_EMERGENCE_THRESHOLD} "
+    f"AND p.occurrence_count < {PATTERN_CONFIRMATION_THRESHOLD} "
+    "AND (p.status IS NULL OR p.status = 'emerging') RETURN count(p)"
+)
+
+_CONFIRMED_PATTERNS_PROBE: Final = (
+    f"MATCH (p:Pattern) WHERE p.occurrence_count >= {PATTERN_CONFIRMATION_THRESHOLD} "
+    "RETURN count(p)"
+)
+
+_BELIEF_CONTRADICTIONS_PROBE: Final = (
+    "MATCH (:Belief)-[r:CONTRADICTS]->(:Belief) RETURN count(r)"
+)
+
+_UNRESOLVED_QUESTIONS_PROBE: Final = (
+    "MATCH (q:Question) WHERE q.resolved_at IS NULL RETURN count(q)"
+)
+
+_FRICTION_INSIGHT_CHAINS_PROBE: Final = (
+    "MATCH (:Friction)-[r:FRICTION_LED_TO_INSIGHT]->(:Insight) RETURN count(r)"
+)
+
+# Short-TTL result cache: pattern_check runs the same read-only probes on
+# every invocation, so repeat calls within the window return the cached
+# dict without touching the graph. Write paths call
+# invalidate_pattern_cache() so a fresh friction/pattern/belief is never
+# masked for longer than it takes to log it.
+_CACHE_TTL = float(os.environ.get("TALOS_PATTERN_CACHE_TTL", "60"))
+_result_cache: dict[tuple, tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate_pattern_cache() -> None:
+    """Drop cached pattern_check results after a graph write."""
+    with _cache_lock:
+        _result_cache.clear()
 
 
 def pattern_check(
@@ -36,15 +139,14 @@ def pattern_check(
     Returns:
         Dict with detected patterns and any generated proposals.
     """
+    cache_key = (session_id, generate_proposals)
+    with _cache_lock:
+        cached = _result_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+        return cached[1]
+
     try:
-        findings = {
-            "recurring_friction": _find_recurring_friction(),
-            "emerging_patterns": _find_emerging_patterns(),
-            "confirmed_patterns": _find_confirmed_patterns(),
-            "belief_contradictions": _find_belief_contradictions(),
-            "unresolved_questions": _find_unresolved_questions(),
-            "friction_insight_chains": _find_friction_insight_chains(),
-        }
+        findings = _collect_findings()
 
         # Calculate significance
         significance = _calculate_significance(findings)
@@ -54,13 +156,16 @@ def pattern_check(
         if generate_proposals and significance["warrants_evolution"]:
             proposals = _generate_evolution_proposals(findings, session_id)
 
-        return {
+        response = {
             "success": True,
             "findings": findings,
             "significance": significance,
             "proposals_generated": proposals,
             "summary": _generate_summary(findings, significance),
         }
+        with _cache_lock:
+            _result_cache[cache_key] = (time.monotonic(), response)
+        return response
 
     except Exception as e:
         return {
@@ -69,171 +174,130 @@ def pattern_check(
         }
 
 
-def _find_recurring_friction() -> list[dict]:
-    """Find friction points that recur frequently."""
-    conn = get_connection()
+def _parse_recurring_friction(result) -> list[dict]:
+    """Bucket friction points that recur frequently."""
+    return [
+        {
+            "id": row[0],
+            "description": row[1],
+            "category": row[2],
+            "recurrence_count": row[3],
+            "resolution": row[4],
+            "severity": row[5],
+        }
+        for row in fetch_rows(result)
+    ]
 
-    result = conn.execute(f"""
-        MATCH (f:Friction)
-        WHERE f.recurrence_count >= {FRICTION_RECURRENCE_THRESHOLD}
-        RETURN f.id, f.description, f.category, f.recurrence_count, f.resolution
-        ORDER BY f.recurrence_count DESC
-        LIMIT 20
-    """)
-
-    frictions = []
-    while result.has_next():
-        row = result.get_next()
-        frictions.append(
-            {
-                "id": row[0],
-                "description": row[1],
-                "category": row[2],
-                "recurrence_count": row[3],
-                "resolution": row[4],
-                "severity": "high" if row[3] >= 5 else "medium",
-            }
-        )
 
-    return frictions
+def _parse_emerging_patterns(result) -> list[dict]:
+    """Bucket patterns that are emerging but not yet confirmed."""
+    return [
+        {
+            "id": row[0],
+            "name": row[1],
+            "description": row[2],
+            "occurrence_count": row[3],
+            "first_noticed": str(row[4]) if row[4] else None,
+            "status": "emerging",
+        }
+        for row in fetch_rows(result)
+    ]
 
 
-def _find_emerging_patterns() -> list[dict]:
-    """Find patterns that are emerging but not yet confirmed."""
-    conn = get_connection()
+def _parse_confirmed_patterns(result) -> list[dict]:
+    """Bucket patterns that have been confirmed through repetition."""
+    return [
+        {
+            "id": row[0],
+            "name": row[1],
+            "description": row[2],
+            "occurrence_count": row[3],
+            "status": row[4],
+        }
+        for row in fetch_rows(result)
+    ]
 
-    result = conn.execute(f"""
-        MATCH (p:Pattern)
-        WHERE p.occurrence_count >= {PATTERN_EMERGENCE_THRESHOLD}
-          AND p.occurrence_count < {PATTERN_CONFIRMATION_THRESHOLD}
-          AND (p.status IS NULL OR p.status = 'emerging')
-        RETURN p.id, p.name, p.description, p.occurrence_count, p.first_noticed
-        ORDER BY p.occurrence_count DESC
-        LIMIT 20
-    """)
-
-    patterns = []
-    while result.has_next():
-        row = result.get_next()
-        patterns.append(
-            {
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "occurrence_count": row[3],
-                "first_noticed": str(row[4]) if row[4] else None,
-                "status": "emerging",
-            }
-        )
 
-    return patterns
+def _parse_belief_contradictions(result) -> list[dict]:
+    """Bucket beliefs that explicitly contradict each other."""
+    return [
+        {
+            "belief_1": {"id": row[0], "content": row[1]},
+            "belief_2": {"id": row[2], "content": row[3]},
+            "resolution": row[4],
+            "resolved": row[5],
+        }
+        for row in fetch_rows(result)
+    ]
 
 
-def _find_confirmed_patterns() -> list[dict]:
-    """Find patterns that have been confirmed through repetition."""
-    conn = get_connection()
+def _parse_unresolved_questions(result) -> list[dict]:
+    """Bucket questions that remain unresolved."""
+    return [
+        {
+            "id": row[0],
+            "content": row[1],
+            "raised_at": str(row[2]) if row[2] else None,
+            "domain": row[3],
+            "urgency": row[4],
+        }
+        for row in fetch_rows(result)
+    ]
 
-    result = conn.execute(f"""
-        MATCH (p:Pattern)
-        WHERE p.occurrence_count >= {PATTERN_CONFIRMATION_THRESHOLD}
-        RETURN p.id, p.name, p.description, p.occurrence_count, p.status
-        ORDER BY p.occurrence_count DESC
-        LIMIT 20
-    """)
-
-    patterns = []
-    while result.has_next():
-        row = result.get_next()
-        patterns.append(
-            {
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "occurrence_count": row[3],
-                "status": row[4] or "confirmed",
-            }
-        )
 
-    return patterns
+def _parse_friction_insight_chains(result) -> list[dict]:
+    """Bucket friction that led to insights (the learning loop in action)."""
+    return [
+        {
+            "friction": {"id": row[0], "description": row[1]},
+            "insight": {"id": row[2], "content": row[3]},
+            "connection_date": str(row[4]) if row[4] else None,
+        }
+        for row in fetch_rows(result)
+    ]
 
 
-def _find_belief_contradictions() -> list[dict]:
-    """Find beliefs that contradict each other."""
-    conn = get_connection()
+# Bucket order of the fused batches: the i-th result parses with the i-th
+# entry. Batched executes replace per-bucket round-trips, letting the
+# engine run the statements back to back off a single submission.
+_FINDINGS_SPEC = (
+    ("recurring_friction", _RECURRING_FRICTION_PROBE, _RECURRING_FRICTION_Q, _parse_recurring_friction),
+    ("emerging_patterns", _EMERGING_PATTERNS_PROBE, _EMERGING_PATTERNS_Q, _parse_emerging_patterns),
+    ("confirmed_patterns", _CONFIRMED_PATTERNS_PROBE, _CONFIRMED_PATTERNS_Q, _parse_confirmed_patterns),
+    ("belief_contradictions", _BELIEF_CONTRADICTIONS_PROBE, _BELIEF_CONTRADICTIONS_Q, _parse_belief_contradictions),
+    ("unresolved_questions", _UNRESOLVED_QUESTIONS_PROBE, _UNRESOLVED_QUESTIONS_Q, _parse_unresolved_questions),
+    ("friction_insight_chains", _FRICTION_INSIGHT_CHAINS_PROBE, _FRICTION_INSIGHT_CHAINS_Q, _parse_friction_insight_chains),
+)
 
-    # Check for explicit CONTRADICTS relationships
-    result = conn.execute("""
-        MATCH (b1:Belief)-[r:CONTRADICTS]->(b2:Belief)
-        RETURN b1.id, b1.content, b2.id, b2.content, r.resolution
-        LIMIT 20
-    """)
-
-    contradictions = []
-    while result.has_next():
-        row = result.get_next()
-        contradictions.append(
-            {
-                "belief_1": {"id": row[0], "content": row[1]},
-                "belief_2": {"id": row[2], "content": row[3]},
-                "resolution": row[4],
-                "resolved": row[4] is not None,
-            }
-        )
+_PROBE_BATCH: Final = "; ".join(probe for _, probe, _, _ in _FINDINGS_SPEC)
 
-    return contradictions
 
+def _collect_findings() -> dict[str, list[dict]]:
+    """Probe bucket counts in one batch, then fetch only non-empty buckets.
 
-def _find_unresolved_questions() -> list[dict]:
-    """Find questions that remain unresolved."""
+    The steady state is six empty buckets, so the common case costs a
+    single batch of count aggregates; the full queries with their
+    ordering and row transfer run only for buckets the probe saw rows in.
+    """
     conn = get_connection()
 
-    result = conn.execute("""
-        MATCH (q:Question)
-        WHERE q.resolved_at IS NULL
-        RETURN q.id, q.content, q.raised_at, q.domain, q.urgency
-        ORDER BY q.raised_at DESC
-        LIMIT 20
-    """)
-
-    questions = []
-    while result.has_next():
-        row = result.get_next()
-        questions.append(
-            {
-                "id": row[0],
-                "content": row[1],
-                "raised_at": str(row[2]) if row[2] else None,
-                "domain": row[3],
-                "urgency": row[4] or "normal",
-            }
-        )
+    probe_results = conn.execute(_PROBE_BATCH)
+    counts = [result.get_next()[0] for result in probe_results]
 
-    return questions
+    findings: dict[str, list[dict]] = {name: [] for name, _, _, _ in _FINDINGS_SPEC}
+    active = [spec for spec, count in zip(_FINDINGS_SPEC, counts) if count]
+    if not active:
+        return findings
 
-
-def _find_friction_insight_chains() -> list[dict]:
-    """Find friction that led to insights (the learning loop in action)."""
-    conn = get_connection()
-
-    result = conn.execute("""
-        MATCH (f:Friction)-[r:FRICTION_LED_TO_INSIGHT]->(i:Insight)
-        RETURN f.id, f.description, i.id, i.content, r.valid_from
-        ORDER BY r.valid_from DESC
-        LIMIT 20
-    """)
-
-    chains = []
-    while result.has_next():
-        row = result.get_next()
-        chains.append(
-            {
-                "friction": {"id": row[0], "description": row[1]},
-                "insight": {"id": row[2], "content": row[3]},
-                "connection_date": str(row[4]) if row[4] else None,
-            }
-        )
-
-    return chains
+    results = conn.execute("; ".join(query for _, _, query, _ in active))
+    if not isinstance(results, list):  # a single statement returns bare
+        results = [results]
+    for (name, _, _, parse), result in zip(active, results):
+        try:
+            findings[name] = parse(result)
+        except Exception:
+            findings[name] = []
+    return findings
 
 
 def _calculate_significance(findings: dict) -> dict:
@@ -295,14 +359,22 @@ def _get_recommendation(score: int, warrants_evolution: bool) -> str:
         return "STABLE: No significant patterns detected. System operating normally."
 
 
+# The proposal files are independent of each other, so the writes overlap
+# on a small pool instead of serializing up to three disk flushes on the
+# calling thread.
+_PROPOSAL_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="talos-proposal")
+
+
 def _generate_evolution_proposals(findings: dict, session_id: str | None) -> list[str]:
     """Generate Evolution proposal files for significant findings.
 
     Returns list of proposal file paths created.
     """
-    proposals = []
+    # One clock read per generation pass; the renderers take the
+    # pre-formatted dates instead of hitting the clock themselves.
     now = datetime.now(timezone.utc)
     date_str = now.strftime("%Y%m%d")
+    date_iso = now.strftime("%Y-%m-%d")
 
     # Get Evolution proposals directory from environment or use default
     evolution_dir = os.environ.get(
@@ -313,69 +385,67 @@ def _generate_evolution_proposals(findings: dict, session_id: str | None) -> lis
     # Ensure directory exists
     os.makedirs(evolution_dir, exist_ok=True)
 
-    # Generate proposal for high-severity recurring friction
+    # Render proposal bodies first, then push every write to the pool.
+    pending = []
+
+    # Proposal for high-severity recurring friction
     high_friction = [f for f in findings["recurring_friction"] if f.get("severity") == "high"]
     if high_friction:
-        proposal_path = _create_friction_proposal(
-            high_friction, evolution_dir, date_str, session_id
+        pending.append(
+            _render_friction_proposal(high_friction, evolution_dir, date_str, date_iso, session_id)
         )
-        if proposal_path:
-            proposals.append(proposal_path)
 
-    # Generate proposal for unresolved belief contradictions
+    # Proposal for unresolved belief contradictions
     unresolved_contradictions = [
         c for c in findings["belief_contradictions"] if not c.get("resolved")
     ]
     if unresolved_contradictions:
-        proposal_path = _create_contradiction_proposal(
-            unresolved_contradictions, evolution_dir, date_str, session_id
+        pending.append(
+            _render_contradiction_proposal(
+                unresolved_contradictions, evolution_dir, date_str, date_iso, session_id
+            )
         )
-        if proposal_path:
-            proposals.append(proposal_path)
 
-    # Generate proposal for confirmed patterns without protocol
+    # Proposal for confirmed patterns without protocol
     confirmed = findings["confirmed_patterns"]
     if confirmed:
-        proposal_path = _create_pattern_proposal(confirmed, evolution_dir, date_str, session_id)
-        if proposal_path:
-            proposals.append(proposal_path)
+        pending.append(
+            _render_pattern_proposal(confirmed, evolution_dir, date_str, date_iso, session_id)
+        )
 
-    return proposals
+    futures = [
+        _PROPOSAL_POOL.submit(_write_proposal, filepath, content)
+        for filepath, content in pending
+    ]
+    return [path for path in (future.result() for future in futures) if path]
 
 
-def _create_friction_proposal(
-    frictions: list[dict],
-    evolution_dir: str,
-    date_str: str,
-    session_id: str | None,
-) -> str | None:
-    """Create Evolution proposal for recurring friction."""
-    # Find next sequence number
-    seq = _get_next_sequence(evolution_dir, date_str)
-    filename = f"evo-{date_str}-{seq:02d}-recurring-friction.md"
-    filepath = os.path.join(evolution_dir, filename)
+def _write_proposal(filepath: str, content: str) -> str | None:
+    """Write one rendered proposal; a failed write drops that proposal."""
+    try:
+        with open(filepath, "w") as f:
+            f.write(content)
+        return filepath
+    except Exception:
+        return None
 
-    # Build friction evidence
-    friction_list = "\n".join(
-        [
-            f"- **{f['description'][:80]}...** (recurred {f['recurrence_count']}x, category: {f['category']})"
-            for f in frictions[:5]
-        ]
-    )
 
-    content = f"""# Evolution Request: Recurring Friction Detected
+# Proposal bodies as plain templates, parsed once at import and rendered
+# with format_map; the old per-call f-strings rebuilt ~40 lines of
+# markdown from scratch for every proposal.
+_FRICTION_PROPOSAL_TMPL: Final = """# Evolution Request: Recurring Friction Detected
 
 ## Metadata
 - **ID:** evo-{date_str}-{seq:02d}
-- **Origin Session:** {session_id or "pattern_check"}
+- **Origin Session:** {origin}
 - **Trigger:** Automated pattern detection found recurring friction
 - **Current Stage:** 1-proposal
-- **Created:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Created:** {created}
 - **Generated By:** talos-telemetry pattern_check
 
 ## The Observation
 
-Pattern detection identified **{len(frictions)} friction point(s)** recurring {FRICTION_RECURRENCE_THRESHOLD}+ times:
+Pattern detection identified **{count} friction point(s)** recurring {threshold}+ times:
 
 {friction_list}
 
@@ -401,7 +471,7 @@ Possible investigations:
 
 ```cypher
 MATCH (f:Friction)
-WHERE f.recurrence_count >= {FRICTION_RECURRENCE_THRESHOLD}
+WHERE f.recurrence_count >= {threshold}
 RETURN f.id, f.description, f.category, f.recurrence_count
 ORDER BY f.recurrence_count DESC
 ```
@@ -409,50 +479,59 @@ ORDER BY f.recurrence_count DESC
 ## Stage History
 
 ### Stage 1: Proposal
-- **Entered:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Entered:** {created}
 - **Notes:** Auto-generated by pattern_check. Governance review recommended.
 """
 
-    try:
-        with open(filepath, "w") as f:
-            f.write(content)
-        return filepath
-    except Exception:
-        return None
-
 
-def _create_contradiction_proposal(
-    contradictions: list[dict],
+def _render_friction_proposal(
+    frictions: list[dict],
     evolution_dir: str,
     date_str: str,
+    date_iso: str,
     session_id: str | None,
-) -> str | None:
-    """Create Evolution proposal for belief contradictions."""
+) -> tuple[str, str]:
+    """Render the Evolution proposal for recurring friction."""
+    # Find next sequence number
     seq = _get_next_sequence(evolution_dir, date_str)
-    filename = f"evo-{date_str}-{seq:02d}-belief-contradictions.md"
+    filename = f"evo-{date_str}-{seq:02d}-recurring-friction.md"
     filepath = os.path.join(evolution_dir, filename)
 
-    # Build contradiction evidence
-    contradiction_list = "\n".join(
+    # Build friction evidence
+    friction_list = "\n".join(
         [
-            f"- **{c['belief_1']['content'][:60]}...** contradicts **{c['belief_2']['content'][:60]}...**"
-            for c in contradictions[:5]
+            f"- **{f['description'][:80]}...** (recurred {f['recurrence_count']}x, category: {f['category']})"
+            for f in frictions[:5]
         ]
     )
 
-    content = f"""# Evolution Request: Belief Contradictions Detected
+    content = _FRICTION_PROPOSAL_TMPL.format_map(
+        {
+            "date_str": date_str,
+            "seq": seq,
+            "origin": session_id or "pattern_check",
+            "created": date_iso,
+            "count": len(frictions),
+            "threshold": FRICTION_RECURRENCE_THRESHOLD,
+            "friction_list": friction_list,
+        }
+    )
+    return filepath, content
+
+
+_CONTRADICTION_PROPOSAL_TMPL: Final = """# Evolution Request: Belief Contradictions Detected
 
 ## Metadata
 - **ID:** evo-{date_str}-{seq:02d}
-- **Origin Session:** {session_id or "pattern_check"}
+- **Origin Session:** {origin}
 - **Trigger:** Automated pattern detection found unresolved belief contradictions
 - **Current Stage:** 1-proposal
-- **Created:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Created:** {created}
 - **Generated By:** talos-telemetry pattern_check
 
 ## The Observation
 
-Pattern detection identified **{len(contradictions)} unresolved belief contradiction(s)**:
+Pattern detection identified **{count} unresolved belief contradiction(s)**:
 
 {contradiction_list}
 
@@ -476,50 +555,57 @@ For each contradiction:
 ## Stage History
 
 ### Stage 1: Proposal
-- **Entered:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Entered:** {created}
 - **Notes:** Auto-generated by pattern_check. Belief reconciliation needed.
 """
 
-    try:
-        with open(filepath, "w") as f:
-            f.write(content)
-        return filepath
-    except Exception:
-        return None
-
 
-def _create_pattern_proposal(
-    patterns: list[dict],
+def _render_contradiction_proposal(
+    contradictions: list[dict],
     evolution_dir: str,
     date_str: str,
+    date_iso: str,
     session_id: str | None,
-) -> str | None:
-    """Create Evolution proposal for confirmed patterns."""
+) -> tuple[str, str]:
+    """Render the Evolution proposal for belief contradictions."""
     seq = _get_next_sequence(evolution_dir, date_str)
-    filename = f"evo-{date_str}-{seq:02d}-confirmed-patterns.md"
+    filename = f"evo-{date_str}-{seq:02d}-belief-contradictions.md"
     filepath = os.path.join(evolution_dir, filename)
 
-    # Build pattern evidence
-    pattern_list = "\n".join(
+    # Build contradiction evidence
+    contradiction_list = "\n".join(
         [
-            f"- **{p['name'] or 'Unnamed'}**: {p['description'][:80]}... (seen {p['occurrence_count']}x)"
-            for p in patterns[:5]
+            f"- **{c['belief_1']['content'][:60]}...** contradicts **{c['belief_2']['content'][:60]}...**"
+            for c in contradictions[:5]
         ]
     )
 
-    content = f"""# Evolution Request: Confirmed Patterns Require Protocol
+    content = _CONTRADICTION_PROPOSAL_TMPL.format_map(
+        {
+            "date_str": date_str,
+            "seq": seq,
+            "origin": session_id or "pattern_check",
+            "created": date_iso,
+            "count": len(contradictions),
+            "contradiction_list": contradiction_list,
+        }
+    )
+    return filepath, content
+
+
+_PATTERN_PROPOSAL_TMPL: Final = """# Evolution Request: Confirmed Patterns Require Protocol
 
 ## Metadata
 - **ID:** evo-{date_str}-{seq:02d}
-- **Origin Session:** {session_id or "pattern_check"}
+- **Origin Session:** {origin}
 - **Trigger:** Automated pattern detection found confirmed behavioral patterns
 - **Current Stage:** 1-proposal
-- **Created:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Created:** {created}
 - **Generated By:** talos-telemetry pattern_check
 
 ## The Observation
 
-Pattern detection identified **{len(patterns)} confirmed pattern(s)** (occurred {PATTERN_CONFIRMATION_THRESHOLD}+ times):
+Pattern detection identified **{count} confirmed pattern(s)** (occurred {threshold}+ times):
 
 {pattern_list}
 
@@ -545,26 +631,68 @@ For each confirmed pattern:
 ## Stage History
 
 ### Stage 1: Proposal
-- **Entered:** {datetime.now(timezone.utc).strftime("%Y-%m-%d")}
+- **Entered:** {created}
 - **Notes:** Auto-generated by pattern_check. Pattern codification recommended.
 """
 
-    try:
-        with open(filepath, "w") as f:
-            f.write(content)
-        return filepath
-    except Exception:
-        return None
+
+def _render_pattern_proposal(
+    patterns: list[dict],
+    evolution_dir: str,
+    date_str: str,
+    date_iso: str,
+    session_id: str | None,
+) -> tuple[str, str]:
+    """Render the Evolution proposal for confirmed patterns."""
+    seq = _get_next_sequence(evolution_dir, date_str)
+    filename = f"evo-{date_str}-{seq:02d}-confirmed-patterns.md"
+    filepath = os.path.join(evolution_dir, filename)
+
+    # Build pattern evidence
+    pattern_list = "\n".join(
+        [
+            f"- **{p['name'] or 'Unnamed'}**: {p['description'][:80]}... (seen {p['occurrence_count']}x)"
+            for p in patterns[:5]
+        ]
+    )
+
+    content = _PATTERN_PROPOSAL_TMPL.format_map(
+        {
+            "date_str": date_str,
+            "seq": seq,
+            "origin": session_id or "pattern_check",
+            "created": date_iso,
+            "count": len(patterns),
+            "threshold": PATTERN_CONFIRMATION_THRESHOLD,
+            "pattern_list": pattern_list,
+        }
+    )
+    return filepath, content
+
+
+# Last allocated proposal sequence per (directory, date): the first
+# request scans the directory once, later ones increment in memory rather
+# than re-listing and re-parsing a growing directory for every proposal.
+_seq_cache: dict[tuple[str, str], int] = {}
+_seq_lock = threading.Lock()
 
 
 def _get_next_sequence(evolution_dir: str, date_str: str) -> int:
-    """Get next sequence number for proposals on this date."""
+    """Allocate the next sequence number for proposals on this date."""
+    key = (evolution_dir, date_str)
+    with _seq_lock:
+        if key not in _seq_cache:
+            _seq_cache[key] = _scan_max_sequence(evolution_dir, date_str)
+        _seq_cache[key] += 1
+        return _seq_cache[key]
+
+
+def _scan_max_sequence(evolution_dir: str, date_str: str) -> int:
+    """Scan the proposals directory for the highest sequence on a date."""
     if not os.path.exists(evolution_dir):
-        return 1
+        return 0
 
     existing = [f for f in os.listdir(evolution_dir) if f.startswith(f"evo-{date_str}-")]
-    if not existing:
-        return 1
 
     # Extract sequence numbers
     sequences = []
@@ -578,7 +706,7 @@ def _get_next_sequence(evolution_dir: str, date_str: str) -> int:
         except ValueError:
             continue
 
-    return max(sequences) + 1 if sequences else 1
+    return max(sequences) if sequences else 0
 
 
 def _generate_summary(findings: dict, significance: dict) -> str:
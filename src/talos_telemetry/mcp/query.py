@@ -56,20 +56,17 @@ def graph_query(
         else:
             result = conn.execute(cypher)
 
-        # Collect results
+        # Collect results; get_n pulls the whole page across the driver
+        # boundary in one call instead of two per row.
         columns = result.get_column_names()
-        rows = []
-
-        while result.has_next() and len(rows) < MAX_ROWS:
-            row = result.get_next()
-            rows.append(list(row))
+        rows = [list(row) for row in result.get_n(MAX_ROWS)]
 
         return {
             "success": True,
             "columns": columns,
             "rows": rows,
             "row_count": len(rows),
-            "truncated": len(rows) == MAX_ROWS,
+            "truncated": result.has_next(),
         }
 
     except Exception as e:
@@ -108,12 +105,15 @@ def count_entities(entity_type: str) -> int:
 
 def find_patterns(min_occurrences: int = 3) -> list[dict]:
     """Find confirmed patterns by occurrence count."""
-    result = graph_query(f"""
+    result = graph_query(
+        """
         MATCH (p:Pattern)
-        WHERE p.occurrence_count >= {min_occurrences}
+        WHERE p.occurrence_count >= $min
         RETURN p.id, p.name, p.description, p.occurrence_count, p.status
         ORDER BY p.occurrence_count DESC
-    """)
+    """,
+        parameters={"min": min_occurrences},
+    )
 
     if not result["success"]:
         return []
@@ -135,12 +135,15 @@ def find_patterns(min_occurrences: int = 3) -> list[dict]:
 
 def find_recurring_friction(min_recurrence: int = 2) -> list[dict]:
     """Find recurring friction points."""
-    result = graph_query(f"""
+    result = graph_query(
+        """
         MATCH (f:Friction)
-        WHERE f.recurrence_count >= {min_recurrence}
+        WHERE f.recurrence_count >= $min
         RETURN f.id, f.description, f.category, f.recurrence_count
         ORDER BY f.recurrence_count DESC
-    """)
+    """,
+        parameters={"min": min_recurrence},
+    )
 
     if not result["success"]:
         return []
@@ -160,17 +163,25 @@ def find_recurring_friction(min_recurrence: int = 2) -> list[dict]:
 
 
 def get_session_summary(session_id: str) -> dict:
-    """Get summary of a session."""
-    result = graph_query(f"""
-        MATCH (s:Session {{id: '{session_id}'}})
-        OPTIONAL MATCH (s)-[:PRODUCED]->(i:Insight)
-        OPTIONAL MATCH (s)-[:PRODUCED]->(f:Friction)
+    """Get summary of a session.
+
+    The PRODUCED relationship tables are typed per label; the untyped
+    PRODUCED the old query matched does not exist, so the whole summary
+    errored out and returned empty.
+    """
+    result = graph_query(
+        """
+        MATCH (s:Session {id: $sid})
+        OPTIONAL MATCH (s)-[:PRODUCED_INSIGHT]->(i:Insight)
+        OPTIONAL MATCH (s)-[:PRODUCED_FRICTION]->(f:Friction)
         OPTIONAL MATCH (s)-[:EXPERIENCED_STATE]->(st:OperationalState)
         RETURN s.goal, s.summary, s.duration_seconds,
                count(DISTINCT i) as insights,
                count(DISTINCT f) as frictions,
                collect(DISTINCT st.name) as states
-    """)
+    """,
+        parameters={"sid": session_id},
+    )
 
     if not result["success"] or not result["rows"]:
         return {}
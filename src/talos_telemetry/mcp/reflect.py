@@ -4,18 +4,54 @@ The reflect tool enables the agent to step back and observe its own operation,
 capturing meta-level insights about the current session or broader patterns.
 """
 
-from datetime import datetime, timezone
 from typing import Any
-from uuid import uuid4
 
-from talos_telemetry.db.connection import get_connection
-from talos_telemetry.embeddings.model import get_embedding
+from talos_telemetry.db.connection import fetch_rows, get_connection
+from talos_telemetry.embeddings.model import get_embedding_list
+from talos_telemetry.mcp._common import new_id, now_iso
 from talos_telemetry.telemetry.events import emit_event
 
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO format string for Kuzu timestamp()."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+# Module-level query text: values bind as parameters, so the stable text
+# hits Kuzu's plan cache and content never passes through escaping. A None
+# trigger binds as NULL, which is also what omitting the property stored.
+_CREATE_REFLECTION = (
+    "CREATE (r:Reflection {id: $id, content: $content, "
+    "occurred_at: timestamp($ts), embedding: $embedding, trigger: $trigger})"
+)
+
+_LINK_SESSION = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (r:Reflection {id: $rid}) "
+    "CREATE (s)-[:PRODUCED_REFLECTION {valid_from: timestamp($ts)}]->(r) "
+    "SET s.degree = coalesce(s.degree, 0) + 1, r.degree = coalesce(r.degree, 0) + 1"
+)
+
+_CREATE_INSIGHT = (
+    "CREATE (i:Insight {id: $id, content: $content, "
+    "created_at: timestamp($ts), domain: 'meta-cognitive', embedding: $embedding})"
+)
+
+_LINK_CRYSTALLIZED = (
+    "MATCH (r:Reflection {id: $rid}) "
+    "MATCH (i:Insight {id: $iid}) "
+    "CREATE (r)-[:REFLECTION_CRYSTALLIZED_INTO {valid_from: timestamp($ts)}]->(i) "
+    "SET r.degree = coalesce(r.degree, 0) + 1, i.degree = coalesce(i.degree, 0) + 1"
+)
+
+_RECENT_BY_SESSION = (
+    "MATCH (s:Session {id: $sid})-[:PRODUCED_REFLECTION]->(r:Reflection) "
+    "RETURN r.id, r.content, r.trigger, r.occurred_at "
+    "ORDER BY r.occurred_at DESC "
+    "LIMIT $k"
+)
+
+_RECENT_ALL = (
+    "MATCH (r:Reflection) "
+    "RETURN r.id, r.content, r.trigger, r.occurred_at "
+    "ORDER BY r.occurred_at DESC "
+    "LIMIT $k"
+)
 
 
 def reflect(
@@ -38,31 +74,33 @@ def reflect(
     try:
         conn = get_connection()
 
+        # One timestamp per request: the reflection and everything
+        # crystallized from it carry the same instant.
+        now = now_iso()
+
         # Generate ID and embedding
-        reflection_id = f"reflection-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
-        embedding = get_embedding(content)
+        reflection_id = new_id("reflection")
+        embedding = get_embedding_list(content)
 
         # Create Reflection entity
-        trigger_clause = f", trigger: '{_escape(trigger)}'" if trigger else ""
-
-        conn.execute(f"""
-            CREATE (r:Reflection {{
-                id: '{reflection_id}',
-                content: '{_escape(content)}',
-                occurred_at: timestamp('{_now_iso()}'),
-                embedding: {embedding}
-                {trigger_clause}
-            }})
-        """)
+        conn.execute(
+            _CREATE_REFLECTION,
+            {
+                "id": reflection_id,
+                "content": content,
+                "ts": now,
+                "embedding": embedding,
+                "trigger": trigger,
+            },
+        )
 
         # Create PRODUCED relationship if session provided
         if session_id:
             try:
-                conn.execute(f"""
-                    MATCH (s:Session {{id: '{session_id}'}})
-                    MATCH (r:Reflection {{id: '{reflection_id}'}})
-                    CREATE (s)-[:PRODUCED_REFLECTION {{valid_from: timestamp('{_now_iso()}')}}]->(r)
-                """)
+                conn.execute(
+                    _LINK_SESSION,
+                    {"sid": session_id, "rid": reflection_id, "ts": now},
+                )
             except Exception:
                 pass
 
@@ -87,27 +125,26 @@ def reflect(
 
         if any(marker in content_lower for marker in insight_markers):
             # Extract potential insight
-            insight_id = f"insight-from-reflection-{uuid4().hex[:8]}"
+            insight_id = new_id("insight-from-reflection")
 
             try:
-                insight_embedding = get_embedding(content)
-
-                conn.execute(f"""
-                    CREATE (i:Insight {{
-                        id: '{insight_id}',
-                        content: '{_escape(content[:500])}',
-                        created_at: timestamp('{_now_iso()}'),
-                        domain: 'meta-cognitive',
-                        embedding: {insight_embedding}
-                    }})
-                """)
+                insight_embedding = get_embedding_list(content)
+
+                conn.execute(
+                    _CREATE_INSIGHT,
+                    {
+                        "id": insight_id,
+                        "content": content[:500],
+                        "ts": now,
+                        "embedding": insight_embedding,
+                    },
+                )
 
                 # Link reflection to insight
-                conn.execute(f"""
-                    MATCH (r:Reflection {{id: '{reflection_id}'}})
-                    MATCH (i:Insight {{id: '{insight_id}'}})
-                    CREATE (r)-[:REFLECTION_CRYSTALLIZED_INTO {{valid_from: timestamp('{_now_iso()}')}}]->(i)
-                """)
+                conn.execute(
+                    _LINK_CRYSTALLIZED,
+                    {"rid": reflection_id, "iid": insight_id, "ts": now},
+                )
 
                 extracted_entities.append(
                     {
@@ -146,11 +183,6 @@ def _classify_reflection(content: str) -> str:
         return "general"
 
 
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
-
-
 def get_recent_reflections(
     limit: int = 10,
     session_id: str | None = None,
@@ -168,31 +200,19 @@ def get_recent_reflections(
         conn = get_connection()
 
         if session_id:
-            result = conn.execute(f"""
-                MATCH (s:Session {{id: '{session_id}'}})-[:PRODUCED_REFLECTION]->(r:Reflection)
-                RETURN r.id, r.content, r.trigger, r.occurred_at
-                ORDER BY r.occurred_at DESC
-                LIMIT {limit}
-            """)
+            result = conn.execute(_RECENT_BY_SESSION, {"sid": session_id, "k": limit})
         else:
-            result = conn.execute(f"""
-                MATCH (r:Reflection)
-                RETURN r.id, r.content, r.trigger, r.occurred_at
-                ORDER BY r.occurred_at DESC
-                LIMIT {limit}
-            """)
-
-        reflections = []
-        while result.has_next():
-            row = result.get_next()
-            reflections.append(
-                {
-                    "id": row[0],
-                    "content": row[1],
-                    "trigger": row[2],
-                    "occurred_at": str(row[3]) if row[3] else None,
-                }
-            )
+            result = conn.execute(_RECENT_ALL, {"k": limit})
+
+        reflections = [
+            {
+                "id": row[0],
+                "content": row[1],
+                "trigger": row[2],
+                "occurred_at": str(row[3]) if row[3] else None,
+            }
+            for row in fetch_rows(result)
+        ]
 
         return {
             "success": True,
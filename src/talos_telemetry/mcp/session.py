@@ -1,15 +1,66 @@
 """Session lifecycle MCP tools."""
 
-from datetime import datetime, timezone
+from datetime import datetime
+from functools import cache
 from typing import Any
 
 from talos_telemetry.db.connection import get_connection
+from talos_telemetry.mcp._common import now_iso
 from talos_telemetry.telemetry.events import emit_session_end, emit_session_start
 
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO format string for Kuzu timestamp()."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+# Module-level query text: values bind as parameters, so the stable text
+# hits Kuzu's plan cache and goals/summaries never pass through escaping.
+_CREATE_SESSION = (
+    "CREATE (s:Session {id: $id, started_at: timestamp($ts), goal: $goal})"
+)
+
+_LINK_HUMAN = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (h:Human {name: $name}) "
+    "CREATE (s)-[:WORKED_WITH {role: 'collaborator'}]->(h) "
+    "SET s.degree = coalesce(s.degree, 0) + 1, h.degree = coalesce(h.degree, 0) + 1"
+)
+
+_LINK_PERSONA = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (p:Persona {name: $name}) "
+    "CREATE (s)-[:ACTIVATED {duration_fraction: 1.0}]->(p) "
+    "SET s.degree = coalesce(s.degree, 0) + 1, p.degree = coalesce(p.degree, 0) + 1"
+)
+
+_LINK_PROTOCOL = (
+    "MATCH (s:Session {id: $sid}) "
+    "MATCH (p:Protocol {name: $name}) "
+    "CREATE (s)-[:FOLLOWED {completed: true}]->(p) "
+    "SET s.degree = coalesce(s.degree, 0) + 1, p.degree = coalesce(p.degree, 0) + 1"
+)
+
+_GET_STARTED_AT = "MATCH (s:Session {id: $sid}) RETURN s.started_at as started_at"
+
+_CLOSE_SESSION = (
+    "MATCH (s:Session {id: $sid}) "
+    "SET s.ended_at = timestamp($ts), s.duration_seconds = $duration"
+)
+
+_CLOSE_SESSION_WITH_SUMMARY = (
+    "MATCH (s:Session {id: $sid}) "
+    "SET s.ended_at = timestamp($ts), s.duration_seconds = $duration, "
+    "s.summary = $summary"
+)
+
+# One round-trip for the close-time counters: produced insights, produced
+# frictions and tool calls all hang off the same Session node, so they
+# aggregate through chained OPTIONAL MATCHes instead of three queries.
+_SESSION_COUNTS = (
+    "MATCH (s:Session {id: $sid}) "
+    "OPTIONAL MATCH (s)-[:PRODUCED_INSIGHT]->(i:Insight) "
+    "WITH s, count(i) AS insights "
+    "OPTIONAL MATCH (s)-[:PRODUCED_FRICTION]->(f:Friction) "
+    "WITH s, insights, count(f) AS frictions "
+    "OPTIONAL MATCH (s)-[u:USED]->(:Tool) "
+    "RETURN insights, frictions, sum(u.count) AS tool_calls"
+)
 
 
 def session_open(
@@ -35,18 +86,15 @@ def session_open(
     """
     try:
         conn = get_connection()
+        # One timestamp per request: the session node and its inherited
+        # snapshot edges carry the same instant.
+        now = now_iso()
 
         # Create Session node
-        conn.execute(f"""
-            CREATE (s:Session {{
-                id: '{session_id}',
-                started_at: timestamp('{_now_iso()}'),
-                goal: '{_escape(goal)}'
-            }})
-        """)
+        conn.execute(_CREATE_SESSION, {"id": session_id, "ts": now, "goal": goal})
 
         # Capture inherited knowledge (temporal snapshot)
-        inherited_summary = _capture_inherited(session_id)
+        inherited_summary = _capture_inherited(conn, session_id, now)
         inherited_count = inherited_summary.get("total", 0)
 
         # Emit telemetry event
@@ -61,31 +109,19 @@ def session_open(
 
         # Create WORKED_WITH relationship
         try:
-            conn.execute(f"""
-                MATCH (s:Session {{id: '{session_id}'}})
-                MATCH (h:Human {{name: '{human}'}})
-                CREATE (s)-[:WORKED_WITH {{role: 'collaborator'}}]->(h)
-            """)
+            conn.execute(_LINK_HUMAN, {"sid": session_id, "name": human})
         except Exception:
             pass  # Human might not exist yet
 
         # Create ACTIVATED relationship for persona
         try:
-            conn.execute(f"""
-                MATCH (s:Session {{id: '{session_id}'}})
-                MATCH (p:Persona {{name: '{persona}'}})
-                CREATE (s)-[:ACTIVATED {{duration_fraction: 1.0}}]->(p)
-            """)
+            conn.execute(_LINK_PERSONA, {"sid": session_id, "name": persona})
         except Exception:
             pass  # Persona might not exist yet
 
         # Create FOLLOWED relationship for protocol
         try:
-            conn.execute(f"""
-                MATCH (s:Session {{id: '{session_id}'}})
-                MATCH (p:Protocol {{name: '{protocol}'}})
-                CREATE (s)-[:FOLLOWED {{completed: true}}]->(p)
-            """)
+            conn.execute(_LINK_PROTOCOL, {"sid": session_id, "name": protocol})
         except Exception:
             pass  # Protocol might not exist yet
 
@@ -133,10 +169,7 @@ def session_close(
         conn = get_connection()
 
         # Get session start time for duration calculation
-        result = conn.execute(f"""
-            MATCH (s:Session {{id: '{session_id}'}})
-            RETURN s.started_at as started_at
-        """)
+        result = conn.execute(_GET_STARTED_AT, {"sid": session_id})
 
         row = result.get_next()
         if not row:
@@ -145,30 +178,21 @@ def session_close(
         started_at = row[0]
         duration_seconds = int((datetime.now() - started_at).total_seconds()) if started_at else 0
 
-        # Update Session node
-        update_parts = [
-            f"s.ended_at = timestamp('{_now_iso()}')",
-            f"s.duration_seconds = {duration_seconds}",
-        ]
+        # Update Session node; the summary branch keeps two stable query
+        # texts rather than templating the SET list per call.
+        close_params = {
+            "sid": session_id,
+            "ts": now_iso(),
+            "duration": duration_seconds,
+        }
         if summary:
-            update_parts.append(f"s.summary = '{_escape(summary)}'")
-
-        conn.execute(f"""
-            MATCH (s:Session {{id: '{session_id}'}})
-            SET {", ".join(update_parts)}
-        """)
+            close_params["summary"] = summary
+            conn.execute(_CLOSE_SESSION_WITH_SUMMARY, close_params)
+        else:
+            conn.execute(_CLOSE_SESSION, close_params)
 
-        # Count produced entities
-        insight_count = _count_produced(session_id, "Insight")
-        friction_count = _count_produced(session_id, "Friction")
-
-        # Count tool usage
-        tool_result = conn.execute(f"""
-            MATCH (s:Session {{id: '{session_id}'}})-[u:USED]->(t:Tool)
-            RETURN sum(u.count) as total
-        """)
-        tool_row = tool_result.get_next()
-        tool_count = tool_row[0] if tool_row and tool_row[0] else 0
+        # Produced-entity and tool-usage counters in a single round-trip
+        insight_count, friction_count, tool_count = _session_counts(conn, session_id)
 
         # Emit telemetry event
         emit_session_end(
@@ -224,17 +248,31 @@ def session_close(
         }
 
 
-def _capture_inherited(session_id: str) -> dict[str, int]:
+@cache
+def _inherit_query(entity_type: str, rel_type: str) -> str:
+    """Build the fan-out snapshot statement for one entity type, cached."""
+    return (
+        f"MATCH (s:Session {{id: $sid}}) "
+        f"MATCH (e:{entity_type}) "
+        f"CREATE (s)-[:{rel_type} {{valid_from: timestamp($ts)}}]->(e) "
+        f"SET e.degree = coalesce(e.degree, 0) + 1 "
+        f"RETURN count(e)"
+    )
+
+
+def _capture_inherited(conn, session_id: str, now: str) -> dict[str, int]:
     """Capture inherited knowledge state at session start.
 
     Creates INHERITED_* relationships from Session to all existing
     knowledge entities, providing a temporal snapshot of "what I knew when".
 
+    One fan-out CREATE per entity type replaces the old read-all-IDs-then-
+    link-one-at-a-time loop, so snapshotting N entities costs seven
+    statements instead of N reads plus N writes.
+
     Returns:
         Dict with counts per entity type and total.
     """
-    conn = get_connection()
-
     # Entity types that can be inherited, with their relationship table names
     entity_types = [
         ("Belief", "INHERITED_BELIEF"),
@@ -250,43 +288,45 @@ def _capture_inherited(session_id: str) -> dict[str, int]:
     total = 0
 
     for entity_type, rel_type in entity_types:
-        count = 0
         try:
-            result = conn.execute(f"MATCH (e:{entity_type}) RETURN e.id")
-            while result.has_next():
-                entity_id = result.get_next()[0]
-                try:
-                    conn.execute(f"""
-                        MATCH (s:Session {{id: '{session_id}'}})
-                        MATCH (e:{entity_type} {{id: '{entity_id}'}})
-                        CREATE (s)-[:{rel_type} {{valid_from: timestamp('{_now_iso()}')}}]->(e)
-                    """)
-                    count += 1
-                    total += 1
-                except Exception:
-                    pass  # Relationship might already exist or entity not found
+            result = conn.execute(
+                _inherit_query(entity_type, rel_type), {"sid": session_id, "ts": now}
+            )
+            row = result.get_next()
+            count = row[0] if row else 0
         except Exception:
-            pass  # Entity type table might not exist yet
+            continue  # Entity type table might not exist yet
 
         if count > 0:
             summary[entity_type.lower() + "s"] = count
+            total += count
+
+    if total:
+        try:
+            conn.execute(
+                "MATCH (s:Session {id: $sid}) "
+                "SET s.degree = coalesce(s.degree, 0) + $n",
+                {"sid": session_id, "n": total},
+            )
+        except Exception:
+            pass
 
     summary["total"] = total
     return summary
 
 
-def _count_produced(session_id: str, entity_type: str) -> int:
-    """Count entities produced by session."""
-    conn = get_connection()
+def _session_counts(conn, session_id: str) -> tuple[int, int, int]:
+    """Fetch insight, friction and tool-call counts for a session at once."""
     try:
-        result = conn.execute(f"""
-            MATCH (s:Session {{id: '{session_id}'}})-[:PRODUCED]->(e:{entity_type})
-            RETURN count(e) as count
-        """)
-        row = result.get_next()
-        return row[0] if row else 0
+        result = conn.execute(_SESSION_COUNTS, {"sid": session_id})
+        row = result.get_next() if result.has_next() else None
     except Exception:
-        return 0
+        return 0, 0, 0
+
+    if not row:
+        return 0, 0, 0
+    # sum() over no USED edges comes back NULL (and as Decimal otherwise).
+    return row[0], row[1], int(row[2]) if row[2] else 0
 
 
 def _get_reflection_prompt() -> str:
@@ -299,8 +339,3 @@ def _get_reflection_prompt() -> str:
 4. What operational states were experienced? (will create EXPERIENCED_STATE relationships)
 
 Respond with natural language; the system will extract entities."""
-
-
-def _escape(text: str) -> str:
-    """Escape text for Cypher queries."""
-    return text.replace("'", "\\'").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,42 @@
+"""Deploy Kuzu schema for Talos Telemetry."""
+
+import sys
+
+from talos_telemetry.db.connection import init_database
+from talos_telemetry.db.kuzu_schema import deploy_and_verify
+
+
+def main():
+    """Deploy schema and verify."""
+    print("Initializing database...")
+    init_database()
+
+    print("Deploying schema...")
+    result = deploy_and_verify()
+
+    print(f"\nSchema deployment results:")
+    print(f"  Node tables: {result['node_tables']} (expected {result['expected_nodes']})")
+    print(f"  Relationship tables: {result['rel_tables']} (expected {result['expected_rels']})")
+
+    if result["missing"]:
+        print(f"\nMissing tables ({len(result['missing'])}):")
+        for name in result["missing"][:10]:  # Limit to 10
+            print(f"  - {name}")
+
+    if result["errors"]:
+        print(f"\nErrors ({len(result['errors'])}):")
+        for error in result["errors"][:10]:  # Limit to 10
+            print(f"  - {error[:100]}")
+
+    success = not result["missing"] and not result["errors"]
+
+    if success:
+        print("\nSchema deployment successful!")
+    else:
+        print("\nSchema deployment had issues.")
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
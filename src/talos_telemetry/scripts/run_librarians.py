@@ -0,0 +1,151 @@
+"""Run the Three Librarians maintenance tasks."""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from talos_telemetry.db.connection import init_database
+from talos_telemetry.librarians import Synthesizer, Protector, Pathfinder
+
+
+def _synthesizer_job():
+    """Construct and run the Synthesizer on the calling thread."""
+    return Synthesizer().run()
+
+
+def _protector_job():
+    """Construct and run the Protector on the calling thread."""
+    return Protector().run()
+
+
+def _pathfinder_job():
+    """Construct and run the Pathfinder on the calling thread."""
+    return Pathfinder().run()
+
+
+def print_synthesizer_result(result):
+    """Print Synthesizer results."""
+    print(f"  Consolidated observations: {result.consolidated_observations}")
+    print(f"  Patterns detected: {result.patterns_detected}")
+    print(f"  Cross-domain connections: {result.cross_domain_connections}")
+
+    if result.report:
+        print("  Report:")
+        for line in result.report:
+            print(f"    - {line}")
+
+
+def print_protector_result(result):
+    """Print Protector results."""
+    print(f"  Duplicates merged: {result.duplicates_merged}")
+    print(f"  Stale questions marked: {result.stale_questions_marked}")
+    print(f"  Sessions archived: {result.sessions_archived}")
+    print(f"  Orphan nodes found: {len(result.orphan_nodes)}")
+    print(f"  Entities pruned: {result.entities_pruned}")
+
+    if result.report:
+        print("  Report:")
+        for line in result.report:
+            print(f"    - {line}")
+
+
+def print_pathfinder_result(result):
+    """Print Pathfinder results."""
+    print(f"  Index status: {len(result.index_status.get('needs_rebuild', []))} need rebuild")
+    print(f"  Domains mapped: {len(result.pathway_map.get('domains', {}))}")
+    print(
+        f"  High connectivity nodes: {len(result.pathway_map.get('high_connectivity_nodes', []))}"
+    )
+    print(f"  Underutilized knowledge: {len(result.underutilized_knowledge)}")
+    print(f"  Semantic clusters: {len(result.semantic_clusters)}")
+
+    if result.report:
+        print("  Report:")
+        for line in result.report:
+            print(f"    - {line}")
+
+
+def run_synthesizer():
+    """Run the Synthesizer (Alchemist)."""
+    print("Running Synthesizer (The Alchemist)...")
+    result = _synthesizer_job()
+    print_synthesizer_result(result)
+    return result
+
+
+def run_protector():
+    """Run the Protector (Guardian)."""
+    print("Running Protector (The Guardian)...")
+    result = _protector_job()
+    print_protector_result(result)
+    return result
+
+
+def run_pathfinder():
+    """Run the Pathfinder (Navigator)."""
+    print("Running Pathfinder (The Navigator)...")
+    result = _pathfinder_job()
+    print_pathfinder_result(result)
+    return result
+
+
+def run_all():
+    """Run all three librarians concurrently.
+
+    The librarians touch largely disjoint subgraphs, and each worker thread
+    gets its own connection over the shared Database, so wall-clock trends
+    toward the slowest librarian rather than the sum of all three. Results
+    print in fixed order once each job finishes.
+    """
+    jobs = [
+        ("Synthesizer (The Alchemist)", _synthesizer_job, print_synthesizer_result),
+        ("Protector (The Guardian)", _protector_job, print_protector_result),
+        ("Pathfinder (The Navigator)", _pathfinder_job, print_pathfinder_result),
+    ]
+
+    print("Running all librarians concurrently...")
+    print()
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [(name, printer, executor.submit(job)) for name, job, printer in jobs]
+        for name, printer, future in futures:
+            print(f"{name} results:")
+            printer(future.result())
+            print()
+
+
+def main():
+    """Run librarians based on arguments."""
+    parser = argparse.ArgumentParser(description="Run Talos Telemetry librarians")
+    parser.add_argument(
+        "--librarian",
+        choices=["synthesizer", "protector", "pathfinder", "all"],
+        default="all",
+        help="Which librarian to run",
+    )
+
+    args = parser.parse_args()
+
+    print("Initializing database...")
+    init_database()
+
+    print()
+
+    if args.librarian == "all":
+        run_all()
+    elif args.librarian == "synthesizer":
+        run_synthesizer()
+        print()
+    elif args.librarian == "protector":
+        run_protector()
+        print()
+    elif args.librarian == "pathfinder":
+        run_pathfinder()
+        print()
+
+    print("Librarian run complete.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
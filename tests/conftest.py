@@ -58,11 +58,17 @@ def fresh_db():
         elif TEST_DB_PATH.is_dir():
             shutil.rmtree(TEST_DB_PATH)
 
+    from talos_telemetry.mcp.patterns import invalidate_pattern_cache
+
     # Initialize fresh db - this will set the module globals
     init_database()
     deploy_schema()
     seed_reference_data()
 
+    # A fresh database must not serve pattern results cached from a
+    # previous test's graph
+    invalidate_pattern_cache()
+
     # Get the connection that MCP tools will also use
     conn = get_connection()
 
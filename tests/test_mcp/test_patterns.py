@@ -10,9 +10,7 @@ from talos_telemetry.mcp.patterns import (
     PATTERN_CONFIRMATION_THRESHOLD,
     PATTERN_EMERGENCE_THRESHOLD,
     _calculate_significance,
-    _find_confirmed_patterns,
-    _find_emerging_patterns,
-    _find_recurring_friction,
+    _collect_findings,
     _generate_summary,
     pattern_check,
 )
@@ -41,7 +39,7 @@ class TestFindRecurringFriction:
             }})
         """)
 
-        result = _find_recurring_friction()
+        result = _collect_findings()["recurring_friction"]
 
         assert len(result) >= 1
         found = next((f for f in result if f["id"] == "friction-recurring-001"), None)
@@ -64,7 +62,7 @@ class TestFindRecurringFriction:
             }})
         """)
 
-        result = _find_recurring_friction()
+        result = _collect_findings()["recurring_friction"]
 
         found = next((f for f in result if f["id"] == "friction-low-001"), None)
         assert found is None
@@ -89,7 +87,7 @@ class TestFindEmergingPatterns:
             }})
         """)
 
-        result = _find_emerging_patterns()
+        result = _collect_findings()["emerging_patterns"]
 
         assert len(result) >= 1
         found = next((p for p in result if p["id"] == "pattern-emerging-001"), None)
@@ -112,7 +110,7 @@ class TestFindEmergingPatterns:
             }})
         """)
 
-        result = _find_emerging_patterns()
+        result = _collect_findings()["emerging_patterns"]
 
         found = next((p for p in result if p["id"] == "pattern-confirmed-001"), None)
         assert found is None
@@ -135,7 +133,7 @@ class TestFindConfirmedPatterns:
             }})
         """)
 
-        result = _find_confirmed_patterns()
+        result = _collect_findings()["confirmed_patterns"]
 
         assert len(result) >= 1
         found = next((p for p in result if p["id"] == "pattern-confirmed-002"), None)